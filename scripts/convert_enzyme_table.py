@@ -4,7 +4,7 @@ import json
 import re
 import sys
 import os
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 
 IUPAC_ALLOWED = set("ACGTRYSWKMBDHVN")
 
@@ -78,12 +78,25 @@ def main():
     skipped_rows: List[int] = []
 
     with open(infile, newline="", encoding="utf-8", errors="ignore") as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader, start=2):
-            name = (row.get("Enzyme") or "").strip()
-            recog = (row.get("Recognition Sequence") or "").strip()
-            cut = (row.get("Cut Site") or "").strip()
-            overhang_raw = (row.get("Overhang Type") or "").strip()
+        # Plain csv.reader: only four known columns are needed, so rows are read
+        # by index instead of building a dict per row. Blank lines are skipped
+        # and missing columns read as "", as with csv.DictReader.
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col = {field: idx for idx, field in enumerate(header)}
+        name_col = col.get("Enzyme")
+        recog_col = col.get("Recognition Sequence")
+        cut_col = col.get("Cut Site")
+        overhang_col = col.get("Overhang Type")
+
+        def cell(row: List[str], idx: Optional[int]) -> str:
+            return row[idx].strip() if idx is not None and idx < len(row) else ""
+
+        for i, row in enumerate((r for r in reader if r), start=2):
+            name = cell(row, name_col)
+            recog = cell(row, recog_col)
+            cut = cell(row, cut_col)
+            overhang_raw = cell(row, overhang_col)
 
             if not name and not recog and not cut:
                 continue
@@ -6,31 +6,52 @@ Provides functions to export restriction digest results to GenBank and CSV forma
 
 import datetime
 import csv
+import os
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Iterator, NamedTuple
 from fragment_calculator import compute_end_metadata
 
 
+# Buffer size for output files written by the CLI (CSV, JSON, SVG, FASTA);
+# coalesces the many small writes issued per row, record, or element
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Buffer size for GenBank output; the file is written as many short lines and
+# is sized separately from WRITE_BUFFER_SIZE
+GENBANK_BUFFER_SIZE = 128 * 1024
+
+
 # ============================================================================
 # DATA MODELS (for type hints)
 # ============================================================================
 
-class Cut:
+class Cut(NamedTuple):
     """Represents a cut site with enzyme metadata."""
-    def __init__(self, pos: int, enzyme: str, recognition_site: str, 
-                 cut_index: int, overhang_type: str, overhang_len: int):
-        self.pos = pos
-        self.enzyme = enzyme
-        self.recognition_site = recognition_site
-        self.cut_index = cut_index
-        self.overhang_type = overhang_type
-        self.overhang_len = overhang_len
+    pos: int
+    enzyme: str
+    recognition_site: str
+    cut_index: int
+    overhang_type: str      # "5' overhang" | "3' overhang" | "Blunt"
+    overhang_len: int
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# LOCUS name sanitizing: every ASCII character outside [A-Za-z0-9_] maps to "_"
+# through a translate table; the regex covers names with non-ASCII characters
+_LOCUS_TABLE = str.maketrans({
+    chr(c): "_" for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")
+})
+_LOCUS_INVALID = re.compile(r'[^A-Za-z0-9_]')
+
+# GenBank month abbreviations (fixed English, independent of the process locale)
+_GB_MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+              "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+
 def gb_date_today() -> str:
     """
     Get current date formatted for GenBank (DD-MMM-YYYY).
@@ -38,7 +59,8 @@ def gb_date_today() -> str:
     Returns:
         Date string in GenBank format
     """
-    return datetime.datetime.now().strftime("%d-%b-%Y").upper()
+    today = datetime.date.today()
+    return f"{today.day:02d}-{_GB_MONTHS[today.month - 1]}-{today.year}"
 
 
 def sanitize_locus_name(path: str) -> str:
@@ -51,14 +73,15 @@ def sanitize_locus_name(path: str) -> str:
     Returns:
         Sanitized LOCUS name
     """
-    # Extract basename without extension
-    import os
+    # Extract basename without extension; sanitizing maps one character to
+    # one character, so truncating first gives the same result
     basename = os.path.basename(path)
-    name = os.path.splitext(basename)[0]
+    name = os.path.splitext(basename)[0][:16]
     
-    # Replace non-alphanumeric with underscore and truncate
-    sanitized = re.sub(r'[^A-Za-z0-9_]', '_', name)
-    return sanitized[:16]
+    # Replace non-alphanumeric with underscore
+    if name.isascii():
+        return name.translate(_LOCUS_TABLE)
+    return _LOCUS_INVALID.sub('_', name)
 
 
 def sanitize_genbank_string(s: str) -> str:
@@ -75,6 +98,26 @@ def sanitize_genbank_string(s: str) -> str:
     return s.replace('"', "'").replace('\n', ' ').replace('\r', ' ')
 
 
+def iter_origin_lines(seq: str) -> Iterator[str]:
+    """
+    Yield GenBank ORIGIN lines one at a time, each terminated by a newline.
+    60 nucleotides per line, grouped in 10-nt blocks, with 1-based index.
+    
+    Args:
+        seq: DNA sequence
+        
+    Yields:
+        Formatted ORIGIN lines
+    """
+    # Lowercase once for the whole sequence rather than once per line
+    seq = seq.lower()
+    for i in range(0, len(seq), 60):
+        line = seq[i:i+60]
+        # Group into 10-nt blocks
+        blocks = " ".join([line[j:j+10] for j in range(0, len(line), 10)])
+        yield f"{i+1:>9} {blocks}\n"
+
+
 def wrap_origin(seq: str) -> str:
     """
     Format sequence for GenBank ORIGIN section.
@@ -86,14 +129,7 @@ def wrap_origin(seq: str) -> str:
     Returns:
         Formatted ORIGIN section lines
     """
-    out = []
-    for i in range(0, len(seq), 60):
-        line = seq[i:i+60].lower()
-        idx = f"{i+1:>9}"
-        # Group into 10-nt blocks
-        blocks = " ".join(line[j:j+10] for j in range(0, len(line), 10))
-        out.append(f"{idx} {blocks}")
-    return "\n".join(out)
+    return "".join(iter_origin_lines(seq))[:-1]
 
 
 def gb_loc_linear(start0: int, end0: int, n: int) -> str:
@@ -156,14 +192,60 @@ def write_feature(f, key: str, location: str, qualifiers: Dict[str, str]):
 # GENBANK EXPORTER
 # ============================================================================
 
-def export_genbank(sequence: str, cuts: List[Dict], fragments: List[Dict], *,
+# misc_feature location line and its /label + /note qualifier block;
+# _MISC_FEATURE_FMT joins them so a feature is %-formatted in one step
+# (location, label, note). Equivalent to write_feature output when both
+# qualifier values are non-empty, which holds for cut and fragment features.
+_MISC_FEATURE_LOC_FMT = "     misc_feature    %s\n"
+_LABEL_NOTE_FMT = (
+    "                     /label=\"%s\"\n"
+    "                     /note=\"%s\"\n"
+)
+_MISC_FEATURE_FMT = _MISC_FEATURE_LOC_FMT + _LABEL_NOTE_FMT
+
+
+@lru_cache(maxsize=256)
+def _cut_qualifiers(enzyme: str, site: str, cut_index: int,
+                    overhang_type: str, overhang_len: int) -> str:
+    """
+    Format the /label and /note qualifier lines of a restriction-site feature.
+    
+    The block depends only on enzyme metadata, so every cut of the same enzyme
+    reuses one cached string.
+    
+    Args:
+        enzyme: Enzyme name
+        site: Recognition sequence
+        cut_index: Cut position within site
+        overhang_type: "5' overhang" | "3' overhang" | "Blunt"
+        overhang_len: Length of overhang
+        
+    Returns:
+        Qualifier lines, newline-terminated
+    """
+    note_parts = []
+    if site:
+        note_parts.append(f"site={site}")
+    note_parts.append(f"cut_index={cut_index}")
+    if overhang_type:
+        note_parts.append(f"overhang={overhang_type}")
+    if overhang_len > 0:
+        note_parts.append(f"k={overhang_len}")
+    
+    return _LABEL_NOTE_FMT % (
+        sanitize_genbank_string(enzyme),
+        sanitize_genbank_string("; ".join(note_parts))
+    )
+
+
+def export_genbank(sequence: str, cuts: List[Cut], fragments: List[Dict], *,
                    path: str, topology: str, definition: str, organism: str) -> None:
     """
     Export restriction digest to GenBank format.
     
     Args:
         sequence: Full DNA sequence
-        cuts: List of cut dictionaries with keys:
+        cuts: List of Cut records with fields:
               - pos (int): 0-based cut position
               - enzyme (str): Enzyme name
               - recognition_site (str): Recognition sequence
@@ -183,7 +265,7 @@ def export_genbank(sequence: str, cuts: List[Dict], fragments: List[Dict], *,
     # Determine topology string
     topo_str = "circular" if topology == "circular" else "linear"
     
-    with open(path, 'w') as f:
+    with open(path, 'w', buffering=GENBANK_BUFFER_SIZE) as f:
         # LOCUS line
         # Format: LOCUS       name    length bp    DNA     topology  date
         f.write(f"LOCUS       {locus_name:<16} {n:>11} bp    DNA     {topo_str:<8} {date_str}\n")
@@ -220,38 +302,12 @@ def export_genbank(sequence: str, cuts: List[Dict], fragments: List[Dict], *,
         
         # 2. Restriction site features (one per cut)
         for cut in cuts:
-            pos = cut['pos']
-            enzyme = cut['enzyme']
-            site = cut.get('recognition_site', '')
-            cut_idx = cut.get('cut_index', 0)
-            overhang = cut.get('overhang_type', 'Unknown')
-            overhang_len = cut.get('overhang_len', 0)
-            
-            # Try to find the recognition site in sequence for accurate annotation
-            # For now, annotate as a single base at the cut position
-            if topology == "circular":
-                site_loc = f"{pos+1}"
-            else:
-                site_loc = f"{pos+1}"
-            
-            # Build note with cut details
-            note_parts = []
-            if site:
-                note_parts.append(f"site={site}")
-            note_parts.append(f"cut_index={cut_idx}")
-            if overhang:
-                note_parts.append(f"overhang={overhang}")
-            if overhang_len > 0:
-                note_parts.append(f"k={overhang_len}")
-            
-            note = "; ".join(note_parts)
-            
-            quals = {
-                "label": enzyme,
-                "note": note
-            }
-            
-            write_feature(f, "misc_feature", site_loc, quals)
+            # Annotate as a single base at the cut position
+            f.write(_MISC_FEATURE_LOC_FMT % (cut.pos + 1))
+            f.write(_cut_qualifiers(
+                cut.enzyme, cut.recognition_site, cut.cut_index,
+                cut.overhang_type, cut.overhang_len
+            ))
         
         # 3. Fragment features
         for frag in fragments:
@@ -274,31 +330,29 @@ def export_genbank(sequence: str, cuts: List[Dict], fragments: List[Dict], *,
             left_str = "START"
             right_str = "END"
             
+            # Only the first enzyme at each boundary is reported
             if left_cut and left_cut.get('enzymes'):
-                left_enzymes = [e['enzyme'] for e in left_cut['enzymes']]
-                left_enz_name = left_enzymes[0] if left_enzymes else "?"
-                left_oh = left_cut['enzymes'][0].get('overhang_type', '') if left_cut['enzymes'] else ''
-                left_str = f"{left_enz_name}({left_oh})"
+                left_meta = left_cut['enzymes'][0]
+                left_str = f"{left_meta.enzyme}({left_meta.overhang_type})"
             
             if right_cut and right_cut.get('enzymes'):
-                right_enzymes = [e['enzyme'] for e in right_cut['enzymes']]
-                right_enz_name = right_enzymes[0] if right_enzymes else "?"
-                right_oh = right_cut['enzymes'][0].get('overhang_type', '') if right_cut['enzymes'] else ''
-                right_str = f"{right_enz_name}({right_oh})"
+                right_meta = right_cut['enzymes'][0]
+                right_str = f"{right_meta.enzyme}({right_meta.overhang_type})"
             
             note = f"length={length}bp; left={left_str}, right={right_str}"
             
-            quals = {
-                "label": f"fragment_{frag_idx}",
-                "note": note
-            }
-            
-            write_feature(f, "misc_feature", frag_loc, quals)
+            f.write(_MISC_FEATURE_FMT % (
+                frag_loc,
+                f"fragment_{frag_idx}",
+                sanitize_genbank_string(note)
+            ))
         
         # ORIGIN
+        # ORIGIN lines stream straight into the buffered file, so the formatted
+        # sequence is never held as one string
         f.write("ORIGIN\n")
-        f.write(wrap_origin(sequence))
-        f.write("\n//\n")
+        f.writelines(iter_origin_lines(sequence))
+        f.write("//\n")
     
     print(f"✓ GenBank file exported: {path}")
 
@@ -307,30 +361,32 @@ def export_genbank(sequence: str, cuts: List[Dict], fragments: List[Dict], *,
 # CSV EXPORTERS
 # ============================================================================
 
-def export_csv(prefix: str, cuts: List[Dict], fragments: List[Dict], 
+def export_csv(prefix: str, cuts: List[Cut], fragments: List[Dict], 
                topology: str, dna_sequence: str) -> None:
     """
     Export restriction digest to CSV files (fragments and cuts).
     
     Args:
         prefix: Output file prefix (will create prefix_fragments.csv and prefix_cuts.csv)
-        cuts: List of cut dictionaries
+        cuts: List of Cut records
         fragments: List of fragment dictionaries
         topology: "circular" or "linear"
         dna_sequence: Full DNA sequence to extract fragment sequences
     """
     # Export fragments CSV
     frag_path = f"{prefix}_fragments.csv"
-    with open(frag_path, 'w', newline='') as csvfile:
+    with open(frag_path, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
         fieldnames = [
             'fragment_id', 'start_idx', 'end_idx', 'mode', 'length',
             'left_enzyme', 'left_overhang_type', 'left_overhang_len', 'left_end_bases',
             'right_enzyme', 'right_overhang_type', 'right_overhang_len', 'right_end_bases',
             'sequence'
         ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
         
+        # Rows are tuples in fieldnames order, written in one writerows call
+        rows = []
         for frag in fragments:
             frag_idx = frag['index']
             start = frag['start']
@@ -355,15 +411,15 @@ def export_csv(prefix: str, cuts: List[Dict], fragments: List[Dict],
             
             if left_cut and left_cut.get('enzymes'):
                 enz_meta = left_cut['enzymes'][0]
-                left_enz = enz_meta['enzyme']
-                left_oh_type = enz_meta.get('overhang_type', '')
+                left_enz = enz_meta.enzyme
+                left_oh_type = enz_meta.overhang_type
                 
                 # Use centralized function to compute end metadata
                 end_meta = compute_end_metadata(
                     dna=dna_sequence,
                     cut_pos=left_cut['pos'],
-                    recognition_site=enz_meta.get('site', ''),
-                    cut_index=enz_meta.get('cut_index', 0),
+                    recognition_site=enz_meta.site,
+                    cut_index=enz_meta.cut_index,
                     overhang_type=left_oh_type,
                     is_left_end=True,
                     circular=(topology == "circular")
@@ -378,15 +434,15 @@ def export_csv(prefix: str, cuts: List[Dict], fragments: List[Dict],
             
             if right_cut and right_cut.get('enzymes'):
                 enz_meta = right_cut['enzymes'][0]
-                right_enz = enz_meta['enzyme']
-                right_oh_type = enz_meta.get('overhang_type', '')
+                right_enz = enz_meta.enzyme
+                right_oh_type = enz_meta.overhang_type
                 
                 # Use centralized function to compute end metadata
                 end_meta = compute_end_metadata(
                     dna=dna_sequence,
                     cut_pos=right_cut['pos'],
-                    recognition_site=enz_meta.get('site', ''),
-                    cut_index=enz_meta.get('cut_index', 0),
+                    recognition_site=enz_meta.site,
+                    cut_index=enz_meta.cut_index,
                     overhang_type=right_oh_type,
                     is_left_end=False,
                     circular=(topology == "circular")
@@ -394,45 +450,29 @@ def export_csv(prefix: str, cuts: List[Dict], fragments: List[Dict],
                 right_oh_len = end_meta['overhang_len']
                 right_bases = end_meta['end_bases']
             
-            writer.writerow({
-                'fragment_id': frag_idx,
-                'start_idx': start,
-                'end_idx': end,
-                'mode': topology,
-                'length': length,
-                'left_enzyme': left_enz,
-                'left_overhang_type': left_oh_type,
-                'left_overhang_len': left_oh_len,
-                'left_end_bases': left_bases,
-                'right_enzyme': right_enz,
-                'right_overhang_type': right_oh_type,
-                'right_overhang_len': right_oh_len,
-                'right_end_bases': right_bases,
-                'sequence': seq
-            })
+            rows.append((
+                frag_idx, start, end, topology, length,
+                left_enz, left_oh_type, left_oh_len, left_bases,
+                right_enz, right_oh_type, right_oh_len, right_bases,
+                seq
+            ))
+        
+        writer.writerows(rows)
     
     print(f"✓ Fragments CSV exported: {frag_path}")
     
     # Export cuts CSV
     cuts_path = f"{prefix}_cuts.csv"
-    with open(cuts_path, 'w', newline='') as csvfile:
+    with open(cuts_path, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
         fieldnames = [
             'cut_id', 'pos', 'enzyme', 'recognition_site', 
             'cut_index', 'overhang_type', 'overhang_len'
         ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
         
-        for idx, cut in enumerate(cuts, 1):
-            writer.writerow({
-                'cut_id': idx,
-                'pos': cut['pos'],
-                'enzyme': cut['enzyme'],
-                'recognition_site': cut.get('recognition_site', ''),
-                'cut_index': cut.get('cut_index', 0),
-                'overhang_type': cut.get('overhang_type', ''),
-                'overhang_len': cut.get('overhang_len', 0)
-            })
+        # Cut fields are already in fieldnames order after cut_id
+        writer.writerows((idx, *cut) for idx, cut in enumerate(cuts, 1))
     
     print(f"✓ Cuts CSV exported: {cuts_path}")
 
@@ -7,6 +7,8 @@ Also includes ASCII agarose gel simulation.
 
 import math
 import random
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Tuple, Optional, NamedTuple
 
 
@@ -25,6 +27,23 @@ class EndInfo(NamedTuple):
     end_bases: str       # 5'->3' bases present at that end
 
 
+class CutMeta(NamedTuple):
+    """Enzyme metadata attached to a cut position (shared by all cuts of that enzyme)."""
+    enzyme: str          # Display name (may carry a "#2" duplicate suffix)
+    site: str            # Recognition sequence (IUPAC)
+    cut_index: int
+    overhang_type: str   # "5' overhang" | "3' overhang" | "Blunt" | "Unknown"
+    actual_enzyme: Optional[str] = None  # Database name when enzyme is a display alias
+
+
+class CutEvent(NamedTuple):
+    """A single enzyme cut at a position, as consumed by the restriction map and SVG renderers."""
+    pos: int
+    enzyme: str
+    site: str
+    overhang_type: str
+
+
 class Fragment(NamedTuple):
     """Complete fragment information including sequence."""
     start_idx: int       # 0-based, inclusive
@@ -47,6 +66,12 @@ IUPAC_MAP = {
     "H": "[ACT]", "V": "[ACG]", "N": "[ACGT]"
 }
 
+# str.translate table for IUPAC_MAP (unmapped characters pass through)
+_IUPAC_TABLE = str.maketrans(IUPAC_MAP)
+
+# Length accessor for fragment dicts (lets sum() reduce without a generator frame)
+_fragment_length = itemgetter('length')
+
 
 def iupac_to_regex(site: str) -> str:
     """
@@ -59,7 +84,7 @@ def iupac_to_regex(site: str) -> str:
         Regex pattern where IUPAC letters are expanded to character classes
     """
     site_upper = site.upper()
-    return "".join(IUPAC_MAP.get(ch, ch) for ch in site_upper)
+    return site_upper.translate(_IUPAC_TABLE)
 
 
 def slice_circular(seq: str, start: int, end: int) -> str:
@@ -247,7 +272,7 @@ def compute_end_metadata(
 def extract_end_bases(
     seq: str,
     cut_pos: int,
-    enzyme_meta: Dict,
+    enzyme_meta: CutMeta,
     is_left_end: bool,
     circular: bool = False
 ) -> str:
@@ -261,16 +286,16 @@ def extract_end_bases(
     Args:
         seq: Full DNA sequence
         cut_pos: Position of the cut
-        enzyme_meta: Dictionary with enzyme information
+        enzyme_meta: CutMeta record for the cutting enzyme
         is_left_end: True if this is the left (5') end of the fragment
         circular: True if sequence is circular
         
     Returns:
         String of bases at the end (5'->3' orientation) - canonical sticky sequence
     """
-    overhang_type = enzyme_meta.get('overhang_type', 'Blunt')
-    recognition_site = enzyme_meta.get('site', '')
-    cut_index = enzyme_meta.get('cut_index', 0)
+    overhang_type = enzyme_meta.overhang_type
+    recognition_site = enzyme_meta.site
+    cut_index = enzyme_meta.cut_index
     
     # Calculate overhang length
     overhang_len = calculate_overhang_length(recognition_site, cut_index)
@@ -306,7 +331,7 @@ def extract_end_bases(
 def extract_sticky_seq(
     seq: str,
     cut_pos: int,
-    enzyme_meta: Dict,
+    enzyme_meta: CutMeta,
     is_left_end: bool,
     circular: bool = False
 ) -> str:
@@ -329,16 +354,16 @@ def extract_sticky_seq(
     Args:
         seq: Full DNA sequence
         cut_pos: Position of the cut
-        enzyme_meta: Dictionary with enzyme information
+        enzyme_meta: CutMeta record for the cutting enzyme
         is_left_end: True if this is the left (5') end of the fragment
         circular: True if sequence is circular
         
     Returns:
         String representing the canonical sticky overhang sequence (5'→3')
     """
-    overhang_type = enzyme_meta.get('overhang_type', 'Blunt')
-    recognition_site = enzyme_meta.get('site', '')
-    cut_index = enzyme_meta.get('cut_index', 0)
+    overhang_type = enzyme_meta.overhang_type
+    recognition_site = enzyme_meta.site
+    cut_index = enzyme_meta.cut_index
     
     # Calculate overhang length
     overhang_len = calculate_overhang_length(recognition_site, cut_index)
@@ -380,7 +405,7 @@ def extract_sticky_seq(
 
 
 def build_end_info(
-    enzyme_meta: Dict,
+    enzyme_meta: CutMeta,
     seq: str,
     cut_pos: int,
     is_left_end: bool,
@@ -394,7 +419,7 @@ def build_end_info(
     have been synchronized to use the same logic.
     
     Args:
-        enzyme_meta: Dictionary with enzyme metadata
+        enzyme_meta: CutMeta record for the cutting enzyme
         seq: Full DNA sequence
         cut_pos: Position of the cut
         is_left_end: True if this is the left end
@@ -403,10 +428,10 @@ def build_end_info(
     Returns:
         EndInfo object
     """
-    enzyme = enzyme_meta['enzyme']
-    recognition_site = enzyme_meta['site']
-    cut_index = enzyme_meta['cut_index']
-    overhang_type = enzyme_meta['overhang_type']
+    enzyme = enzyme_meta.enzyme
+    recognition_site = enzyme_meta.site
+    cut_index = enzyme_meta.cut_index
+    overhang_type = enzyme_meta.overhang_type
     
     # Use the centralized function for consistency
     metadata = compute_end_metadata(
@@ -434,12 +459,68 @@ def build_end_info(
 # FRAGMENT COMPUTATION (LEGACY)
 # ============================================================================
 
+def _normalize_cut_positions(cut_positions: List[int], seq_len: int) -> List[int]:
+    """
+    Wrap cut positions into [0, seq_len), deduplicate and sort them.
+    
+    A set comprehension feeds sorted() directly, avoiding the intermediate
+    generator that set() would otherwise drain.
+    
+    Args:
+        cut_positions: Cut positions, possibly unnormalized or repeated
+        seq_len: Length of the DNA sequence (must be positive)
+        
+    Returns:
+        Sorted list of unique normalized cut positions
+    """
+    return sorted({p % seq_len for p in cut_positions})
+
+
+def _map_enzymes_to_positions(
+    positions: List[int],
+    cut_positions: List[int],
+    seq_len: int,
+    cut_metadata: Dict[int, List[CutMeta]]
+) -> Dict[int, List[CutMeta]]:
+    """
+    Map each normalized cut position to the enzymes cutting there.
+    
+    Cut positions are grouped by position modulo seq_len in a single pass, so
+    the cost is linear in the number of cuts rather than cuts x positions.
+    Enzymes keep their cut_positions order and are deduplicated by name.
+    
+    Args:
+        positions: Sorted, normalized cut positions to report
+        cut_positions: Original (possibly unnormalized) cut positions
+        seq_len: Length of the DNA sequence
+        cut_metadata: Dictionary mapping cut position to list of CutMeta records
+        
+    Returns:
+        Dictionary mapping each position in positions to its list of CutMeta records
+    """
+    pos_to_enzymes = {pos: [] for pos in positions}
+    seen = {pos: set() for pos in positions}
+    for orig_pos in cut_positions:
+        # Single hash per cut: fetch the metadata list instead of testing membership first
+        metas = cut_metadata.get(orig_pos)
+        if not metas:
+            continue
+        normalized = orig_pos % seq_len
+        unique_enzymes = pos_to_enzymes[normalized]
+        seen_names = seen[normalized]
+        for enz_meta in metas:
+            if enz_meta.enzyme not in seen_names:
+                seen_names.add(enz_meta.enzyme)
+                unique_enzymes.append(enz_meta)
+    return pos_to_enzymes
+
+
 def compute_fragments(
     cut_positions: List[int],
     seq_len: int,
     circular: bool = False,
     circular_single_cut_linearizes: bool = False,
-    cut_metadata: Dict[int, List[Dict]] = None
+    cut_metadata: Dict[int, List[CutMeta]] = None
 ) -> List[Dict]:
     """
     Compute DNA fragments after restriction enzyme cutting.
@@ -449,8 +530,7 @@ def compute_fragments(
         seq_len: Length of the DNA sequence
         circular: If True, treat DNA as circular; if False, treat as linear
         circular_single_cut_linearizes: If True and circular, one cut yields two fragments
-        cut_metadata: Dictionary mapping cut position to list of enzyme metadata dicts
-                     Each dict contains: {enzyme, site, cut_index, overhang_type}
+        cut_metadata: Dictionary mapping cut position to list of CutMeta records
         
     Returns:
         List of fragment dictionaries with keys:
@@ -472,49 +552,34 @@ def compute_fragments(
         cut_metadata = {}
     
     # Normalize and deduplicate cut positions
-    ps = sorted(set(p % seq_len for p in cut_positions))
+    ps = _normalize_cut_positions(cut_positions, seq_len)
     n = len(ps)
     
+    # No cuts, or one cut that leaves a circle intact: the whole molecule is a single
+    # fragment without cut boundaries, so skip the metadata mapping entirely
+    if n == 0 or (circular and n == 1 and not circular_single_cut_linearizes):
+        return [{
+            'index': 0,
+            'length': seq_len,
+            'start': 0,
+            'end': 0 if circular else seq_len,
+            'wraps': bool(circular),
+            'boundaries': {
+                'left_cut': None,
+                'right_cut': None
+            }
+        }]
+    
     # Build position-to-enzyme mapping with metadata
-    pos_to_enzymes = {}
-    for pos in ps:
-        # Get all enzymes that cut at this position (handling modulo)
-        enzymes_at_pos = []
-        for orig_pos in cut_positions:
-            normalized = orig_pos % seq_len
-            if normalized == pos and orig_pos in cut_metadata:
-                enzymes_at_pos.extend(cut_metadata[orig_pos])
-        
-        # Deduplicate by enzyme name
-        seen = set()
-        unique_enzymes = []
-        for enz_meta in enzymes_at_pos:
-            if enz_meta['enzyme'] not in seen:
-                seen.add(enz_meta['enzyme'])
-                unique_enzymes.append(enz_meta)
-        
-        pos_to_enzymes[pos] = unique_enzymes
+    pos_to_enzymes = _map_enzymes_to_positions(ps, cut_positions, seq_len, cut_metadata)
+    
+    # One boundary record per cut, aligned with ps: the fragments on either
+    # side of cut k both refer to cut_bounds[k] (records are read-only)
+    cut_bounds = [{'pos': pos, 'enzymes': pos_to_enzymes[pos]} for pos in ps]
     
     if not circular:
-        # Linear mode
-        if n == 0:
-            # No cuts - return entire sequence
-            return [{
-                'index': 0,
-                'length': seq_len,
-                'start': 0,
-                'end': seq_len,
-                'wraps': False,
-                'boundaries': {
-                    'left_cut': None,
-                    'right_cut': None
-                }
-            }]
-        
-        fragments = []
-        
-        # First fragment: from sequence start to first cut
-        fragments.append({
+        # Linear mode. First fragment: from sequence start to first cut
+        fragments = [{
             'index': 0,
             'length': ps[0],
             'start': 0,
@@ -522,34 +587,25 @@ def compute_fragments(
             'wraps': False,
             'boundaries': {
                 'left_cut': None,  # Sequence start
-                'right_cut': {
-                    'pos': ps[0],
-                    'enzymes': pos_to_enzymes.get(ps[0], [])
-                }
+                'right_cut': cut_bounds[0]
             }
-        })
+        }]
         
-        # Middle fragments: between consecutive cuts
-        for i in range(n - 1):
-            start = ps[i]
-            end = ps[i + 1]
-            fragments.append({
-                'index': i + 1,
+        # Middle fragments: between consecutive cuts, built in one pass
+        fragments.extend(
+            {
+                'index': i,
                 'length': end - start,
                 'start': start,
                 'end': end,
                 'wraps': False,
                 'boundaries': {
-                    'left_cut': {
-                        'pos': start,
-                        'enzymes': pos_to_enzymes.get(start, [])
-                    },
-                    'right_cut': {
-                        'pos': end,
-                        'enzymes': pos_to_enzymes.get(end, [])
-                    }
+                    'left_cut': cut_bounds[i - 1],
+                    'right_cut': cut_bounds[i]
                 }
-            })
+            }
+            for i, (start, end) in enumerate(zip(ps, ps[1:]), 1)
+        )
         
         # Last fragment: from last cut to sequence end
         fragments.append({
@@ -559,10 +615,7 @@ def compute_fragments(
             'end': seq_len,
             'wraps': False,
             'boundaries': {
-                'left_cut': {
-                    'pos': ps[-1],
-                    'enzymes': pos_to_enzymes.get(ps[-1], [])
-                },
+                'left_cut': cut_bounds[-1],
                 'right_cut': None  # Sequence end
             }
         })
@@ -571,123 +624,53 @@ def compute_fragments(
     
     else:
         # Circular mode
-        if n == 0:
-            # No cuts - intact circle
-            return [{
-                'index': 0,
-                'length': seq_len,
-                'start': 0,
-                'end': 0,
-                'wraps': True,
-                'boundaries': {
-                    'left_cut': None,
-                    'right_cut': None
-                }
-            }]
-        
         if n == 1:
-            # One cut
-            if circular_single_cut_linearizes:
-                # Two fragments: linearized plasmid split at the cut
-                p0 = ps[0]
-                return [
-                    {
-                        'index': 0,
-                        'length': seq_len - p0,
-                        'start': p0,
-                        'end': seq_len,
-                        'wraps': False,
-                        'boundaries': {
-                            'left_cut': {
-                                'pos': p0,
-                                'enzymes': pos_to_enzymes.get(p0, [])
-                            },
-                            'right_cut': {
-                                'pos': p0,
-                                'enzymes': pos_to_enzymes.get(p0, [])
-                            }
-                        }
-                    },
-                    {
-                        'index': 1,
-                        'length': p0,
-                        'start': 0,
-                        'end': p0,
-                        'wraps': False,
-                        'boundaries': {
-                            'left_cut': {
-                                'pos': p0,
-                                'enzymes': pos_to_enzymes.get(p0, [])
-                            },
-                            'right_cut': {
-                                'pos': p0,
-                                'enzymes': pos_to_enzymes.get(p0, [])
-                            }
-                        }
-                    }
-                ]
-            else:
-                # One fragment - intact circle (single cut doesn't fragment)
-                return [{
+            # One cut with circular_single_cut_linearizes: two fragments,
+            # linearized plasmid split at the cut
+            p0 = ps[0]
+            return [
+                {
                     'index': 0,
-                    'length': seq_len,
+                    'length': seq_len - p0,
+                    'start': p0,
+                    'end': seq_len,
+                    'wraps': False,
+                    'boundaries': {
+                        'left_cut': cut_bounds[0],
+                        'right_cut': cut_bounds[0]
+                    }
+                },
+                {
+                    'index': 1,
+                    'length': p0,
                     'start': 0,
-                    'end': 0,
-                    'wraps': True,
+                    'end': p0,
+                    'wraps': False,
                     'boundaries': {
-                        'left_cut': None,
-                        'right_cut': None
+                        'left_cut': cut_bounds[0],
+                        'right_cut': cut_bounds[0]
                     }
-                }]
-        
-        # Multiple cuts in circular mode
-        fragments = []
-        
-        # Fragments between consecutive cuts
-        for i in range(n - 1):
-            start = ps[i]
-            end = ps[i + 1]
-            fragments.append({
+                }
+            ]
+        
+        # Multiple cuts in circular mode: pair each cut with the next one around
+        # the circle, so the final pair (last cut -> first cut) is the
+        # wrap-around fragment. Modular length and end < start cover it without
+        # a separate branch. Fragment i runs from cut i to cut (i + 1) mod n.
+        return [
+            {
                 'index': i,
-                'length': end - start,
+                'length': (end - start) % seq_len,
                 'start': start,
                 'end': end,
-                'wraps': False,
+                'wraps': end < start,
                 'boundaries': {
-                    'left_cut': {
-                        'pos': start,
-                        'enzymes': pos_to_enzymes.get(start, [])
-                    },
-                    'right_cut': {
-                        'pos': end,
-                        'enzymes': pos_to_enzymes.get(end, [])
-                    }
-                }
-            })
-        
-        # Wrap-around fragment: from last cut, around origin, to first cut
-        start = ps[-1]
-        end = ps[0]
-        length = (seq_len - start) + end
-        fragments.append({
-            'index': n - 1,
-            'length': length,
-            'start': start,
-            'end': end,
-            'wraps': True,
-            'boundaries': {
-                'left_cut': {
-                    'pos': start,
-                    'enzymes': pos_to_enzymes.get(start, [])
-                },
-                'right_cut': {
-                    'pos': end,
-                    'enzymes': pos_to_enzymes.get(end, [])
+                    'left_cut': cut_bounds[i],
+                    'right_cut': cut_bounds[i + 1 - n]
                 }
             }
-        })
-        
-        return fragments
+            for i, (start, end) in enumerate(zip(ps, ps[1:] + ps[:1]))
+        ]
 
 
 def validate_fragment_total(fragments: List[Dict], expected_length: int) -> bool:
@@ -701,8 +684,7 @@ def validate_fragment_total(fragments: List[Dict], expected_length: int) -> bool
     Returns:
         True if lengths sum correctly, False otherwise
     """
-    total = sum(f['length'] for f in fragments)
-    return total == expected_length
+    return sum(map(_fragment_length, fragments)) == expected_length
 
 
 # ============================================================================
@@ -714,7 +696,7 @@ def compute_fragments_with_sequences(
     cut_positions: List[int],
     circular: bool = False,
     circular_single_cut_linearizes: bool = False,
-    cut_metadata: Dict[int, List[Dict]] = None
+    cut_metadata: Dict[int, List[CutMeta]] = None
 ) -> List[Fragment]:
     """
     Compute DNA fragments with full sequence information after restriction enzyme cutting.
@@ -724,8 +706,7 @@ def compute_fragments_with_sequences(
         cut_positions: List of cut position indices [0, seq_len)
         circular: If True, treat DNA as circular; if False, treat as linear
         circular_single_cut_linearizes: If True and circular, one cut yields two fragments
-        cut_metadata: Dictionary mapping cut position to list of enzyme metadata dicts
-                     Each dict contains: {enzyme, site, cut_index, overhang_type}
+        cut_metadata: Dictionary mapping cut position to list of CutMeta records
         
     Returns:
         List of Fragment namedtuples with sequence and end information
@@ -740,45 +721,28 @@ def compute_fragments_with_sequences(
         cut_metadata = {}
     
     # Normalize and deduplicate cut positions
-    ps = sorted(set(p % seq_len for p in cut_positions))
+    ps = _normalize_cut_positions(cut_positions, seq_len)
     n = len(ps)
     
+    # No cuts, or one cut that leaves a circle intact: the whole molecule is a single
+    # fragment without cut ends, so skip the metadata mapping and end extraction
+    if n == 0 or (circular and n == 1 and not circular_single_cut_linearizes):
+        return [Fragment(
+            start_idx=0,
+            end_idx=0 if circular else seq_len,
+            length=seq_len,
+            sequence=dna_sequence,
+            enzymes_at_ends=(None, None),
+            wraps=circular
+        )]
+    
     # Build position-to-enzyme mapping with metadata
-    pos_to_enzymes = {}
-    for pos in ps:
-        # Get all enzymes that cut at this position (handling modulo)
-        enzymes_at_pos = []
-        for orig_pos in cut_positions:
-            normalized = orig_pos % seq_len
-            if normalized == pos and orig_pos in cut_metadata:
-                enzymes_at_pos.extend(cut_metadata[orig_pos])
-        
-        # Deduplicate by enzyme name
-        seen = set()
-        unique_enzymes = []
-        for enz_meta in enzymes_at_pos:
-            if enz_meta['enzyme'] not in seen:
-                seen.add(enz_meta['enzyme'])
-                unique_enzymes.append(enz_meta)
-        
-        pos_to_enzymes[pos] = unique_enzymes
+    pos_to_enzymes = _map_enzymes_to_positions(ps, cut_positions, seq_len, cut_metadata)
     
     fragments = []
     
     if not circular:
         # ========== LINEAR MODE ==========
-        if n == 0:
-            # No cuts - return entire sequence
-            frag = Fragment(
-                start_idx=0,
-                end_idx=seq_len,
-                length=seq_len,
-                sequence=dna_sequence,
-                enzymes_at_ends=(None, None),
-                wraps=False
-            )
-            return [frag]
-        
         # First fragment: from sequence start to first cut
         frag_seq = dna_sequence[0:ps[0]]
         right_enzymes = pos_to_enzymes.get(ps[0], [])
@@ -831,58 +795,33 @@ def compute_fragments_with_sequences(
         
     else:
         # ========== CIRCULAR MODE ==========
-        if n == 0:
-            # No cuts - intact circle
-            frag = Fragment(
-                start_idx=0,
-                end_idx=0,
-                length=seq_len,
-                sequence=dna_sequence,
-                enzymes_at_ends=(None, None),
-                wraps=True
-            )
-            return [frag]
-        
         if n == 1:
-            # One cut
-            if circular_single_cut_linearizes:
-                # Two fragments: linearized plasmid split at the cut
-                p0 = ps[0]
-                enzymes_at_p0 = pos_to_enzymes.get(p0, [])
-                end_info = build_end_info(enzymes_at_p0[0], dna_sequence, p0, True, circular) if enzymes_at_p0 else None
-                
-                # Fragment 1: from cut to end of sequence
-                frag1_seq = dna_sequence[p0:seq_len]
-                fragments.append(Fragment(
-                    start_idx=p0,
-                    end_idx=seq_len,
-                    length=seq_len - p0,
-                    sequence=frag1_seq,
-                    enzymes_at_ends=(end_info, end_info),
-                    wraps=False
-                ))
-                
-                # Fragment 2: from start to cut
-                frag2_seq = dna_sequence[0:p0]
-                fragments.append(Fragment(
-                    start_idx=0,
-                    end_idx=p0,
-                    length=p0,
-                    sequence=frag2_seq,
-                    enzymes_at_ends=(end_info, end_info),
-                    wraps=False
-                ))
-            else:
-                # One fragment - intact circle (single cut doesn't fragment)
-                frag = Fragment(
-                    start_idx=0,
-                    end_idx=0,
-                    length=seq_len,
-                    sequence=dna_sequence,
-                    enzymes_at_ends=(None, None),
-                    wraps=True
-                )
-                return [frag]
+            # One cut (intact circle returned above): linearized plasmid split at the cut
+            p0 = ps[0]
+            enzymes_at_p0 = pos_to_enzymes.get(p0, [])
+            end_info = build_end_info(enzymes_at_p0[0], dna_sequence, p0, True, circular) if enzymes_at_p0 else None
+            
+            # Fragment 1: from cut to end of sequence
+            frag1_seq = dna_sequence[p0:seq_len]
+            fragments.append(Fragment(
+                start_idx=p0,
+                end_idx=seq_len,
+                length=seq_len - p0,
+                sequence=frag1_seq,
+                enzymes_at_ends=(end_info, end_info),
+                wraps=False
+            ))
+            
+            # Fragment 2: from start to cut
+            frag2_seq = dna_sequence[0:p0]
+            fragments.append(Fragment(
+                start_idx=0,
+                end_idx=p0,
+                length=p0,
+                sequence=frag2_seq,
+                enzymes_at_ends=(end_info, end_info),
+                wraps=False
+            ))
         else:
             # Multiple cuts in circular mode
             
@@ -940,7 +879,7 @@ def extract_fragment_ends_for_ligation(
     cut_positions: List[int],
     circular: bool = False,
     circular_single_cut_linearizes: bool = False,
-    cut_metadata: Dict[int, List[Dict]] = None
+    cut_metadata: Dict[int, List[CutMeta]] = None
 ) -> List:
     """
     Extract all fragment ends for ligation compatibility analysis.
@@ -952,7 +891,7 @@ def extract_fragment_ends_for_ligation(
         cut_positions: List of cut position indices
         circular: If True, treat DNA as circular
         circular_single_cut_linearizes: If True and circular, one cut yields two fragments
-        cut_metadata: Dictionary mapping cut position to enzyme metadata
+        cut_metadata: Dictionary mapping cut position to list of CutMeta records
         
     Returns:
         List of EndInfo objects with sticky_seq for ligation analysis
@@ -970,28 +909,11 @@ def extract_fragment_ends_for_ligation(
         cut_metadata = {}
     
     # Normalize and deduplicate cut positions
-    ps = sorted(set(p % seq_len for p in cut_positions))
+    ps = _normalize_cut_positions(cut_positions, seq_len)
     n = len(ps)
     
     # Build position-to-enzyme mapping with metadata
-    pos_to_enzymes = {}
-    for pos in ps:
-        # Get all enzymes that cut at this position
-        enzymes_at_pos = []
-        for orig_pos in cut_positions:
-            normalized = orig_pos % seq_len
-            if normalized == pos and orig_pos in cut_metadata:
-                enzymes_at_pos.extend(cut_metadata[orig_pos])
-        
-        # Deduplicate by enzyme name
-        seen = set()
-        unique_enzymes = []
-        for enz_meta in enzymes_at_pos:
-            if enz_meta['enzyme'] not in seen:
-                seen.add(enz_meta['enzyme'])
-                unique_enzymes.append(enz_meta)
-        
-        pos_to_enzymes[pos] = unique_enzymes
+    pos_to_enzymes = _map_enzymes_to_positions(ps, cut_positions, seq_len, cut_metadata)
     
     ends = []
     
@@ -1010,9 +932,9 @@ def extract_fragment_ends_for_ligation(
                 if i > 0 or cut_pos > 0:
                     sticky_seq = extract_sticky_seq(dna_sequence, cut_pos, enzyme_meta, False, circular)
                     end = LigationEndInfo(
-                        enzyme=enzyme_meta['enzyme'],
-                        overhang_type=enzyme_meta['overhang_type'],
-                        overhang_len=calculate_overhang_length(enzyme_meta['site'], enzyme_meta['cut_index']),
+                        enzyme=enzyme_meta.enzyme,
+                        overhang_type=enzyme_meta.overhang_type,
+                        overhang_len=calculate_overhang_length(enzyme_meta.site, enzyme_meta.cut_index),
                         sticky_seq=sticky_seq,
                         polarity="left",
                         fragment_id=i + 1,
@@ -1024,9 +946,9 @@ def extract_fragment_ends_for_ligation(
                 if i < n - 1 or cut_pos < seq_len:
                     sticky_seq = extract_sticky_seq(dna_sequence, cut_pos, enzyme_meta, True, circular)
                     end = LigationEndInfo(
-                        enzyme=enzyme_meta['enzyme'],
-                        overhang_type=enzyme_meta['overhang_type'],
-                        overhang_len=calculate_overhang_length(enzyme_meta['site'], enzyme_meta['cut_index']),
+                        enzyme=enzyme_meta.enzyme,
+                        overhang_type=enzyme_meta.overhang_type,
+                        overhang_len=calculate_overhang_length(enzyme_meta.site, enzyme_meta.cut_index),
                         sticky_seq=sticky_seq,
                         polarity="right",
                         fragment_id=i,
@@ -1053,9 +975,9 @@ def extract_fragment_ends_for_ligation(
                     sticky_seq_right = extract_sticky_seq(dna_sequence, cut_pos, enzyme_meta, False, circular)
                     
                     end_left = LigationEndInfo(
-                        enzyme=enzyme_meta['enzyme'],
-                        overhang_type=enzyme_meta['overhang_type'],
-                        overhang_len=calculate_overhang_length(enzyme_meta['site'], enzyme_meta['cut_index']),
+                        enzyme=enzyme_meta.enzyme,
+                        overhang_type=enzyme_meta.overhang_type,
+                        overhang_len=calculate_overhang_length(enzyme_meta.site, enzyme_meta.cut_index),
                         sticky_seq=sticky_seq_left,
                         polarity="left",
                         fragment_id=0,
@@ -1063,9 +985,9 @@ def extract_fragment_ends_for_ligation(
                     )
                     
                     end_right = LigationEndInfo(
-                        enzyme=enzyme_meta['enzyme'],
-                        overhang_type=enzyme_meta['overhang_type'],
-                        overhang_len=calculate_overhang_length(enzyme_meta['site'], enzyme_meta['cut_index']),
+                        enzyme=enzyme_meta.enzyme,
+                        overhang_type=enzyme_meta.overhang_type,
+                        overhang_len=calculate_overhang_length(enzyme_meta.site, enzyme_meta.cut_index),
                         sticky_seq=sticky_seq_right,
                         polarity="right",
                         fragment_id=0,
@@ -1085,9 +1007,9 @@ def extract_fragment_ends_for_ligation(
                     # Left end of fragment starting at this cut
                     sticky_seq_left = extract_sticky_seq(dna_sequence, cut_pos, enzyme_meta, True, circular)
                     end_left = LigationEndInfo(
-                        enzyme=enzyme_meta['enzyme'],
-                        overhang_type=enzyme_meta['overhang_type'],
-                        overhang_len=calculate_overhang_length(enzyme_meta['site'], enzyme_meta['cut_index']),
+                        enzyme=enzyme_meta.enzyme,
+                        overhang_type=enzyme_meta.overhang_type,
+                        overhang_len=calculate_overhang_length(enzyme_meta.site, enzyme_meta.cut_index),
                         sticky_seq=sticky_seq_left,
                         polarity="left",
                         fragment_id=i,
@@ -1098,9 +1020,9 @@ def extract_fragment_ends_for_ligation(
                     # Right end of fragment ending at this cut
                     sticky_seq_right = extract_sticky_seq(dna_sequence, cut_pos, enzyme_meta, False, circular)
                     end_right = LigationEndInfo(
-                        enzyme=enzyme_meta['enzyme'],
-                        overhang_type=enzyme_meta['overhang_type'],
-                        overhang_len=calculate_overhang_length(enzyme_meta['site'], enzyme_meta['cut_index']),
+                        enzyme=enzyme_meta.enzyme,
+                        overhang_type=enzyme_meta.overhang_type,
+                        overhang_len=calculate_overhang_length(enzyme_meta.site, enzyme_meta.cut_index),
                         sticky_seq=sticky_seq_right,
                         polarity="right",
                         fragment_id=(i - 1) % n,  # Wrap around for circular
@@ -1180,46 +1102,42 @@ def _make_scale_lines(seq_len: int, map_width: int, map_ticks: int, circular: bo
     return ''.join(label_chars), ''.join(ruler_chars)
 
 
-def _group_cuts_by_enzyme(cut_events: List[Dict]) -> Dict[str, List[int]]:
+def _group_cuts_by_enzyme(cut_events: List[CutEvent]) -> Dict[str, List[int]]:
     """
     Group cut events by enzyme name.
     
     Args:
-        cut_events: List of cut event dictionaries with keys: pos, enzyme, overhang_type, site
+        cut_events: List of CutEvent records
         
     Returns:
         Dictionary mapping enzyme name to list of positions
     """
     enzyme_cuts = {}
     for event in cut_events:
-        enzyme = event['enzyme']
-        pos = event['pos']
+        enzyme = event.enzyme
+        pos = event.pos
         if enzyme not in enzyme_cuts:
             enzyme_cuts[enzyme] = []
         enzyme_cuts[enzyme].append(pos)
     return enzyme_cuts
 
 
-def _group_cuts_by_position(cut_events: List[Dict]) -> Dict[int, List[Dict]]:
+def _group_cuts_by_position(cut_events: List[CutEvent]) -> Dict[int, List[CutEvent]]:
     """
     Group cut events by position.
     
     Args:
-        cut_events: List of cut event dictionaries
+        cut_events: List of CutEvent records
         
     Returns:
-        Dictionary mapping position to list of enzyme info dicts
+        Dictionary mapping position to the cut events at that position
     """
     pos_cuts = {}
     for event in cut_events:
-        pos = event['pos']
+        pos = event.pos
         if pos not in pos_cuts:
             pos_cuts[pos] = []
-        pos_cuts[pos].append({
-            'enzyme': event['enzyme'],
-            'overhang_type': event['overhang_type'],
-            'site': event['site']
-        })
+        pos_cuts[pos].append(event)
     return pos_cuts
 
 
@@ -1262,7 +1180,7 @@ def _render_track_line(
 
 def build_restriction_map(
     L: int,
-    cut_events: List[Dict],
+    cut_events: List[CutEvent],
     *,
     circular: bool = False,
     map_width: int = 80,
@@ -1278,7 +1196,7 @@ def build_restriction_map(
     
     Args:
         L: Length of the DNA sequence
-        cut_events: List of cut event dictionaries with keys:
+        cut_events: List of CutEvent records with fields:
                    - pos: int (cut position)
                    - enzyme: str (enzyme name)
                    - overhang_type: str (from enzymes.json)
@@ -1299,7 +1217,7 @@ def build_restriction_map(
         return "Error: Sequence length must be positive"
     
     # Deduplicate cut events by position
-    unique_positions = sorted(set(event['pos'] for event in cut_events))
+    unique_positions = sorted(set(event.pos for event in cut_events))
     n_cuts = len(unique_positions)
     
     # Build position-to-enzymes mapping
@@ -1359,8 +1277,8 @@ def build_restriction_map(
                 # Collect unique overhang types for this enzyme
                 overhang_types = set()
                 for event in cut_events:
-                    if event['enzyme'] == enzyme:
-                        overhang_types.add(event['overhang_type'])
+                    if event.enzyme == enzyme:
+                        overhang_types.add(event.overhang_type)
                 if overhang_types:
                     overhang_str = ', '.join(sorted(overhang_types))
                     annotations.append(f"[{overhang_str}]")
@@ -1369,8 +1287,8 @@ def build_restriction_map(
                 # Get site (use first occurrence)
                 site = None
                 for event in cut_events:
-                    if event['enzyme'] == enzyme:
-                        site = event['site']
+                    if event.enzyme == enzyme:
+                        site = event.site
                         break
                 if site:
                     # Truncate if too long
@@ -1390,13 +1308,13 @@ def build_restriction_map(
             events = pos_to_events[pos]
             
             # Build enzyme list
-            enzyme_names = [e['enzyme'] for e in events]
+            enzyme_names = [e.enzyme for e in events]
             enzyme_str = ', '.join(enzyme_names)
             
             # Build overhang list if requested
             annotations = []
             if show_overhangs:
-                overhang_types = set(e['overhang_type'] for e in events)
+                overhang_types = set(e.overhang_type for e in events)
                 overhang_str = ', '.join(sorted(overhang_types))
                 annotations.append(f"[{overhang_str}]")
             
@@ -1429,6 +1347,7 @@ def build_restriction_map(
 # AGAROSE GEL SIMULATION
 # ============================================================================
 
+@lru_cache(maxsize=32)
 def gel_coefficients(percent: float) -> Tuple[float, float]:
     """
     Get migration coefficients (a, b) for the log-linear model based on agarose %.
@@ -1463,42 +1382,104 @@ def gel_coefficients(percent: float) -> Tuple[float, float]:
         return (1.5, -0.35)  # Best for very small fragments
 
 
-def calculate_migration_row(
-    bp: int,
+@lru_cache(maxsize=64)
+def _migration_model(
     gel_percent: float,
     gel_length: int,
     dye_front: float
-) -> int:
+) -> Tuple[float, float, int]:
     """
-    Calculate the row index for a DNA fragment based on size.
+    Resolve the per-gel constants of the migration model once.
+    
+    Every fragment on a gel shares the agarose coefficients and the
+    dye-front row, so they are computed once per gel configuration.
     
     Args:
-        bp: Fragment size in base pairs
         gel_percent: Agarose concentration
         gel_length: Total gel height in rows
         dye_front: Dye front position (0-1 fraction down the gel)
         
+    Returns:
+        Tuple of (a, b, max_row)
+    """
+    a, b = gel_coefficients(gel_percent)
+    max_row = int((gel_length - 1) * dye_front)
+    return a, b, max_row
+
+
+def _row_for_size(bp: int, a: float, b: float, max_row: int) -> int:
+    """
+    Calculate the row index for one fragment size from resolved gel constants.
+    
+    Args:
+        bp: Fragment size in base pairs
+        a: Migration intercept (from _migration_model)
+        b: Migration slope (from _migration_model)
+        max_row: Dye-front row (from _migration_model)
+        
     Returns:
         Row index where the band appears
     """
     if bp <= 0:
         return 0
     
-    # Get migration coefficients
-    a, b = gel_coefficients(gel_percent)
-    
     # Calculate normalized position (0 = top, 1 = bottom)
     y_norm = a + b * math.log10(bp)
     y_norm = max(0.0, min(1.0, y_norm))  # Clamp to [0, 1]
     
     # Convert to row index (wells at top, bands migrate down)
-    max_row = int((gel_length - 1) * dye_front)
     row = int(y_norm * max_row)
     
     # Ensure band is below wells (row 0-1 are wells)
-    row = max(2, row)
+    return max(2, row)
+
+
+def _migration_rows(
+    sizes: List[int],
+    gel_percent: float,
+    gel_length: int,
+    dye_front: float
+) -> List[int]:
+    """
+    Calculate the row index for each fragment size in one pass.
     
-    return row
+    The per-gel constants are resolved once for the whole batch rather than
+    once per fragment.
+    
+    Args:
+        sizes: Fragment sizes in base pairs
+        gel_percent: Agarose concentration
+        gel_length: Total gel height in rows
+        dye_front: Dye front position (0-1 fraction down the gel)
+        
+    Returns:
+        Row indices, in the same order as sizes
+    """
+    a, b, max_row = _migration_model(gel_percent, gel_length, dye_front)
+    return [_row_for_size(bp, a, b, max_row) for bp in sizes]
+
+
+def calculate_migration_row(
+    bp: int,
+    gel_percent: float,
+    gel_length: int,
+    dye_front: float
+) -> int:
+    """
+    Calculate the row index for a DNA fragment based on size.
+    
+    Args:
+        bp: Fragment size in base pairs
+        gel_percent: Agarose concentration
+        gel_length: Total gel height in rows
+        dye_front: Dye front position (0-1 fraction down the gel)
+        
+    Returns:
+        Row index where the band appears
+    """
+    # Migration coefficients and dye-front row (cached per gel configuration)
+    a, b, max_row = _migration_model(gel_percent, gel_length, dye_front)
+    return _row_for_size(bp, a, b, max_row)
 
 
 def merge_bands(
@@ -1530,14 +1511,13 @@ def merge_bands(
     # Sort fragments by size
     sorted_fragments = sorted(fragments)
     
-    # Calculate row for each fragment
-    fragment_rows = [(bp, calculate_migration_row(bp, gel_percent, gel_length, dye_front)) 
-                     for bp in sorted_fragments]
+    # Calculate row for each fragment in a single batch
+    fragment_rows = _migration_rows(sorted_fragments, gel_percent, gel_length, dye_front)
     
     # Group by row and merge threshold
     bands = {}  # row -> list of bp values
     
-    for bp, row in fragment_rows:
+    for bp, row in zip(sorted_fragments, fragment_rows):
         placed = False
         
         # Check if we can merge with existing band at this row
@@ -1568,6 +1548,38 @@ def merge_bands(
     return bands
 
 
+# Band glyph indexed by intensity (fragments merged into the band), capped at 4
+_BAND_GLYPHS = ('·', '·', '•', '▮', '█')
+
+
+@lru_cache(maxsize=64)
+def _ladder_bands(
+    ladder_bp: Tuple[int, ...],
+    merge_threshold: int,
+    gel_percent: float,
+    gel_length: int,
+    dye_front: float
+) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """
+    Merge a ladder into bands once per ladder and gel configuration.
+    
+    The same ladder is drawn on every gel (and on every step of a plan), so
+    its bands are cached in an immutable form; callers rebuild a fresh dict.
+    
+    Args:
+        ladder_bp: Ladder fragment sizes
+        merge_threshold: Size difference threshold for merging (bp)
+        gel_percent: Agarose concentration
+        gel_length: Gel height in rows
+        dye_front: Dye front position
+        
+    Returns:
+        Tuple of (row, sizes) pairs in merge_bands order
+    """
+    bands = merge_bands(list(ladder_bp), merge_threshold, gel_percent, gel_length, dye_front)
+    return tuple((row, tuple(bp_list)) for row, bp_list in bands.items())
+
+
 def get_band_glyph(intensity: int) -> str:
     """
     Get the character glyph for a band based on intensity (number of merged fragments).
@@ -1578,14 +1590,7 @@ def get_band_glyph(intensity: int) -> str:
     Returns:
         Character to display
     """
-    if intensity >= 4:
-        return '█'
-    elif intensity >= 3:
-        return '▮'
-    elif intensity >= 2:
-        return '•'
-    else:
-        return '·'
+    return _BAND_GLYPHS[max(0, min(intensity, 4))]
 
 
 def add_smear(
@@ -1633,25 +1638,24 @@ def add_smear(
                     canvas[row][lane_col] = '.' if rand_val < 0.20 else ','
 
 
-def render_circular_topology_bands(
+@lru_cache(maxsize=64)
+def _topology_rows(
     L: int,
-    topology: str,
     gel_percent: float,
     gel_length: int,
     dye_front: float
-) -> Dict[int, List[tuple]]:
+) -> Tuple[int, int]:
     """
-    Render plasmid topology forms (supercoiled, nicked, linear) for circular DNA with 0 cuts.
+    Rows of the supercoiled and open-circular forms of an intact plasmid.
     
     Args:
         L: Plasmid size in bp
-        topology: "native" or "auto"
         gel_percent: Agarose concentration
         gel_length: Gel height in rows
         dye_front: Dye front position
         
     Returns:
-        Dictionary mapping row to list of (label, size) tuples
+        Tuple of (sc_row, oc_row)
     """
     # Calculate where linear form would migrate
     linear_row = calculate_migration_row(L, gel_percent, gel_length, dye_front)
@@ -1669,6 +1673,31 @@ def render_circular_topology_bands(
     sc_row = max(2, min(gel_length - 1, sc_row))
     oc_row = max(2, min(gel_length - 1, oc_row))
     
+    return sc_row, oc_row
+
+
+def render_circular_topology_bands(
+    L: int,
+    topology: str,
+    gel_percent: float,
+    gel_length: int,
+    dye_front: float
+) -> Dict[int, List[tuple]]:
+    """
+    Render plasmid topology forms (supercoiled, nicked, linear) for circular DNA with 0 cuts.
+    
+    Args:
+        L: Plasmid size in bp
+        topology: "native" or "auto"
+        gel_percent: Agarose concentration
+        gel_length: Gel height in rows
+        dye_front: Dye front position
+        
+    Returns:
+        Dictionary mapping row to list of (label, size) tuples
+    """
+    sc_row, oc_row = _topology_rows(L, gel_percent, gel_length, dye_front)
+    
     bands = {}
     bands[sc_row] = [('SC', L)]
     bands[oc_row] = [('OC', L)]
@@ -1724,15 +1753,20 @@ def simulate_gel(
     lane_width = (gel_width - (total_lanes - 1) * lane_gap) // total_lanes
     lane_width = max(1, lane_width)
     
-    # Initialize canvas
-    canvas = [[' ' for _ in range(gel_width)] for _ in range(gel_length)]
+    # Initialize canvas: one mutable row per gel line, filled by list repetition
+    canvas = [[' '] * gel_width for _ in range(gel_length)]
     
     # Track lane info for legend
     lane_info = []
     
     # Process ladder first
     ladder_label = "Ladder"
-    ladder_bands = merge_bands(ladder_bp, merge_threshold, gel_percent, gel_length, dye_front)
+    ladder_bands = {
+        row: list(bp_list)
+        for row, bp_list in _ladder_bands(
+            tuple(ladder_bp), merge_threshold, gel_percent, gel_length, dye_front
+        )
+    }
     ladder_col = lane_width // 2
     lane_info.append({
         'label': ladder_label,
@@ -1796,23 +1830,20 @@ def simulate_gel(
         
         for row, bp_list in bands.items():
             if row < gel_length and col < gel_width:
-                intensity = len(bp_list)
-                glyph = get_band_glyph(intensity)
-                canvas[row][col] = glyph
+                # Inline get_band_glyph: bands always hold at least one fragment
+                canvas[row][col] = _BAND_GLYPHS[min(len(bp_list), 4)]
         
         # Add smear if requested
         add_smear(canvas, col, bands, smear, gel_length, seed=42)
     
-    # Draw dye front line
-    dye_row = int((gel_length - 1) * dye_front)
-    if 2 <= dye_row < gel_length:
-        for c in range(gel_width):
-            if canvas[dye_row][c] == ' ':
-                canvas[dye_row][c] = '~'
-    
     # Convert canvas to string
     gel_lines = [''.join(row) for row in canvas]
     
+    # Draw dye front line through every empty cell of its row
+    dye_row = int((gel_length - 1) * dye_front)
+    if 2 <= dye_row < gel_length:
+        gel_lines[dye_row] = gel_lines[dye_row].replace(' ', '~')
+    
     # Build legend on the right side
     legend_lines = []
     legend_lines.append(f"  Agarose: {gel_percent}%")
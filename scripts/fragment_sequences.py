@@ -17,10 +17,15 @@ from fragment_calculator import (
     compute_fragments_with_sequences,
     Fragment,
     EndInfo,
-    slice_circular
+    slice_circular,
+    CutMeta
 )
 
 
+# Deletion table stripping line breaks and spaces from sequence files in one pass
+_SEQ_WHITESPACE = str.maketrans("", "", "\n ")
+
+
 def extract_fragment_sequence(
     dna_sequence: str,
     start_position: int,
@@ -129,12 +134,12 @@ def get_fragment_with_sequence(
             cut_sites.append(pos)
             if pos not in cut_metadata:
                 cut_metadata[pos] = []
-            cut_metadata[pos].append({
-                'enzyme': enzyme_name,
-                'site': site,
-                'cut_index': cut_index,
-                'overhang_type': overhang_type
-            })
+            cut_metadata[pos].append(CutMeta(
+                enzyme=enzyme_name,
+                site=site,
+                cut_index=cut_index,
+                overhang_type=overhang_type
+            ))
     
     # Step 2: Compute fragments with sequences
     fragments = compute_fragments_with_sequences(
@@ -356,7 +361,7 @@ def main():
         print("="*70)
         
         with open(test_seq_path, 'r') as f:
-            test_seq = f.read().strip().replace('\n', '').replace(' ', '').upper()
+            test_seq = f.read().strip().translate(_SEQ_WHITESPACE).upper()
         
         enzymes = ["HaeIII", "HinfI"]
         
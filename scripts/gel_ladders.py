@@ -11,16 +11,20 @@ LADDER_PRESETS = {
     "broad": [100, 200, 500, 1000, 1500, 2000, 3000, 4000, 5000, 7000, 10000, 12000],
 }
 
+# Immutable copies of the presets, shared by every caller without copying
+# (also usable directly as cache keys by the gel simulator)
+_LADDER_TUPLES = {name: tuple(sizes) for name, sizes in LADDER_PRESETS.items()}
 
-def get_ladder(name: str) -> list:
+
+def _resolve_ladder_name(name: str) -> str:
     """
-    Get ladder fragment sizes by name (case-insensitive).
+    Normalize a ladder name and check that it is a known preset.
     
     Args:
-        name: Name of the ladder preset ("100bp", "1kb", "broad") - case insensitive
+        name: Name of the ladder preset - case insensitive
         
     Returns:
-        List of fragment sizes in base pairs
+        Lowercase preset name
         
     Raises:
         ValueError: If ladder name is not recognized
@@ -30,8 +34,39 @@ def get_ladder(name: str) -> list:
         # Show lowercase options to make clear input is case-insensitive
         available = ", ".join(sorted(LADDER_PRESETS.keys()))
         raise ValueError(f"Unknown ladder '{name_lower}'. Available ladders (case-insensitive): {available}")
+    return name_lower
+
+
+def get_ladder(name: str) -> list:
+    """
+    Get ladder fragment sizes by name (case-insensitive).
     
-    return LADDER_PRESETS[name_lower]
+    Args:
+        name: Name of the ladder preset ("100bp", "1kb", "broad") - case insensitive
+        
+    Returns:
+        List of fragment sizes in base pairs
+        
+    Raises:
+        ValueError: If ladder name is not recognized
+    """
+    return LADDER_PRESETS[_resolve_ladder_name(name)]
+
+
+def get_ladder_tuple(name: str) -> tuple:
+    """
+    Get ladder fragment sizes by name as a shared immutable tuple.
+    
+    Args:
+        name: Name of the ladder preset ("100bp", "1kb", "broad") - case insensitive
+        
+    Returns:
+        Tuple of fragment sizes in base pairs
+        
+    Raises:
+        ValueError: If ladder name is not recognized
+    """
+    return _LADDER_TUPLES[_resolve_ladder_name(name)]
 
 
 def get_available_ladders() -> list:
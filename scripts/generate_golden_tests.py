@@ -6,7 +6,7 @@ Task 12.1: Generate test cases for 2 linear sequences × 3 enzyme sets and 1 cir
 
 import json
 from sim import load_enzyme_database, find_cut_positions_linear, merge_cut_positions
-from fragment_calculator import compute_fragments, extract_fragment_ends_for_ligation
+from fragment_calculator import compute_fragments, extract_fragment_ends_for_ligation, CutMeta
 from ligation_compatibility import calculate_compatibility
 
 def generate_test_cases():
@@ -83,13 +83,13 @@ def generate_test_cases():
                 for pos in enz_cuts:
                     if pos not in cut_metadata:
                         cut_metadata[pos] = []
-                    cut_metadata[pos].append({
-                        'enzyme': enz_name,
-                        'actual_enzyme': enz_name,
-                        'site': enz_info['sequence'],
-                        'cut_index': enz_info['cut_index'],
-                        'overhang_type': enz_info['overhang_type']
-                    })
+                    cut_metadata[pos].append(CutMeta(
+                        enzyme=enz_name,
+                        site=enz_info['sequence'],
+                        cut_index=enz_info['cut_index'],
+                        overhang_type=enz_info['overhang_type'],
+                        actual_enzyme=enz_name
+                    ))
             
             # Merge all cut positions
             all_cuts = merge_cut_positions(cuts_by_enzyme, len(sequence))
@@ -115,14 +115,14 @@ def generate_test_cases():
                 
                 left_info = {
                     'position': left_cut['pos'] if left_cut else None,
-                    'enzymes': [e['enzyme'] for e in left_cut['enzymes']] if left_cut else [],
-                    'overhang_types': [e['overhang_type'] for e in left_cut['enzymes']] if left_cut else []
+                    'enzymes': [e.enzyme for e in left_cut['enzymes']] if left_cut else [],
+                    'overhang_types': [e.overhang_type for e in left_cut['enzymes']] if left_cut else []
                 }
                 
                 right_info = {
                     'position': right_cut['pos'] if right_cut else None,
-                    'enzymes': [e['enzyme'] for e in right_cut['enzymes']] if right_cut else [],
-                    'overhang_types': [e['overhang_type'] for e in right_cut['enzymes']] if right_cut else []
+                    'enzymes': [e.enzyme for e in right_cut['enzymes']] if right_cut else [],
+                    'overhang_types': [e.overhang_type for e in right_cut['enzymes']] if right_cut else []
                 }
                 
                 overhang_info.append({
@@ -6,7 +6,23 @@ Generates SVG/PNG visualizations of plasmid maps, linear maps, and fragment diag
 
 import math
 import hashlib
-from typing import List, Dict
+import re
+from typing import Dict, Iterable, List, Tuple, Union
+from fragment_calculator import CutEvent
+
+# SVG minification patterns: inter-tag whitespace, tag spans, over-precise
+# decimals, and attributes that only restate SVG defaults. Decimal rounding and
+# default removal are applied inside tags only, never to text content such as
+# a user-supplied title.
+_SVG_INTERTAG_WS = re.compile(r">\s+<")
+_SVG_TAG = re.compile(r"<[A-Za-z/][^<>]*>")
+_SVG_LONG_DECIMAL = re.compile(r"\d+\.\d{3,}")
+_SVG_DEFAULT_ATTRS = re.compile(r'\s(?:style=""|stroke-width="1")(?=[\s/>])')
+
+# cairosvg module (or the error from loading it), resolved once per process and
+# shared by every PNG conversion; a failed import is not cached by Python itself
+_cairosvg = None
+_cairosvg_error = None
 
 
 def _hash_color(text: str) -> str:
@@ -94,9 +110,28 @@ def _avoid_label_collision(
     return adjusted
 
 
+def _circle_directions(
+    positions: Iterable[int],
+    L: int,
+    origin: int
+) -> List[Tuple[float, float, float]]:
+    """
+    Compute (angle, cos, sin) for each position on a circular map.
+    
+    Angles start at 12 o'clock and run clockwise from ``origin``. Every
+    coordinate drawn for a position (tick, label, leader line) is a radius
+    scaled from the same direction, so each sin/cos is evaluated only once.
+    """
+    directions = []
+    for pos in positions:
+        angle_rad = 2 * math.pi * ((pos - origin) % L) / L - math.pi / 2
+        directions.append((angle_rad, math.cos(angle_rad), math.sin(angle_rad)))
+    return directions
+
+
 def render_plasmid_map(
     L: int,
-    cuts: List[Dict],
+    cuts: List[CutEvent],
     *,
     title: str = "Plasmid",
     origin: int = 0,
@@ -111,7 +146,7 @@ def render_plasmid_map(
     
     Args:
         L: Plasmid length in bp
-        cuts: List of cut dictionaries with keys:
+        cuts: List of CutEvent records with fields:
               - pos: int (cut position)
               - enzyme: str (enzyme name)
               - site: str (recognition sequence)
@@ -173,15 +208,16 @@ def render_plasmid_map(
     
     # Draw tick marks every 1000 bp or ceil(L/10)
     tick_interval = max(100, int(math.ceil(L / 10 / 100) * 100))
-    for pos in range(0, L, tick_interval):
-        angle_rad = 2 * math.pi * ((pos - origin) % L) / L - math.pi / 2
-        x1 = center + radius * math.cos(angle_rad)
-        y1 = center + radius * math.sin(angle_rad)
+    tick_positions = range(0, L, tick_interval)
+    for pos, (_, cos_a, sin_a) in zip(tick_positions,
+                                      _circle_directions(tick_positions, L, origin)):
+        x1 = center + radius * cos_a
+        y1 = center + radius * sin_a
         
         # Small tick
         tick_len = 8 if pos % 1000 == 0 else 4
-        x2 = center + (radius - tick_len) * math.cos(angle_rad)
-        y2 = center + (radius - tick_len) * math.sin(angle_rad)
+        x2 = center + (radius - tick_len) * cos_a
+        y2 = center + (radius - tick_len) * sin_a
         
         svg_lines.append(f'  <line x1="{x1:.1f}" y1="{y1:.1f}" '
                         f'x2="{x2:.1f}" y2="{y2:.1f}" '
@@ -190,8 +226,8 @@ def render_plasmid_map(
         # Label major ticks
         if pos % 1000 == 0:
             label_radius = radius - 20
-            lx = center + label_radius * math.cos(angle_rad)
-            ly = center + label_radius * math.sin(angle_rad)
+            lx = center + label_radius * cos_a
+            ly = center + label_radius * sin_a
             svg_lines.append(f'  <text x="{lx:.1f}" y="{ly:.1f}" '
                            f'text-anchor="middle" dominant-baseline="middle" '
                            f'class="size">{pos}</text>')
@@ -199,24 +235,24 @@ def render_plasmid_map(
     # Group cuts by position
     cuts_by_pos = {}
     for cut in cuts:
-        pos = cut['pos']
+        pos = cut.pos
         if pos not in cuts_by_pos:
             cuts_by_pos[pos] = []
         cuts_by_pos[pos].append(cut)
     
     # Draw cut markers and labels
     labels = []
-    for pos, enzymes_at_pos in sorted(cuts_by_pos.items()):
-        angle_rad = 2 * math.pi * ((pos - origin) % L) / L - math.pi / 2
-        
+    sorted_cuts = sorted(cuts_by_pos.items())
+    directions = _circle_directions([pos for pos, _ in sorted_cuts], L, origin)
+    for (pos, enzymes_at_pos), (angle_rad, cos_a, sin_a) in zip(sorted_cuts, directions):
         # Draw tick mark
-        x1 = center + radius * math.cos(angle_rad)
-        y1 = center + radius * math.sin(angle_rad)
-        x2 = center + (radius + 15) * math.cos(angle_rad)
-        y2 = center + (radius + 15) * math.sin(angle_rad)
+        x1 = center + radius * cos_a
+        y1 = center + radius * sin_a
+        x2 = center + (radius + 15) * cos_a
+        y2 = center + (radius + 15) * sin_a
         
         # Use color from first enzyme at this position
-        color = _hash_color(enzymes_at_pos[0]['enzyme'])
+        color = _hash_color(enzymes_at_pos[0].enzyme)
         
         svg_lines.append(f'  <line x1="{x1:.1f}" y1="{y1:.1f}" '
                         f'x2="{x2:.1f}" y2="{y2:.1f}" '
@@ -224,17 +260,17 @@ def render_plasmid_map(
         
         # Create label
         label_radius = radius + 30
-        lx = center + label_radius * math.cos(angle_rad)
-        ly = center + label_radius * math.sin(angle_rad)
+        lx = center + label_radius * cos_a
+        ly = center + label_radius * sin_a
         
         # Build label text
         if len(enzymes_at_pos) > 1:
             label_text = f"×{len(enzymes_at_pos)} @ {pos}"
         else:
             enzyme = enzymes_at_pos[0]
-            parts = [enzyme['enzyme']]
+            parts = [enzyme.enzyme]
             if show_sites:
-                parts.append(f"({enzyme['site']})")
+                parts.append(f"({enzyme.site})")
             label_text = f"{' '.join(parts)} @ {pos}"
         
         labels.append({
@@ -244,6 +280,7 @@ def render_plasmid_map(
             'color': color,
             'pos': pos,
             'angle': angle_rad,
+            'tick_end': (x2, y2),
             'enzymes': enzymes_at_pos
         })
     
@@ -256,8 +293,7 @@ def render_plasmid_map(
         
         # Draw leader line if needed
         if label.get('needs_leader', False):
-            x_tick = center + (radius + 15) * math.cos(label['angle'])
-            y_tick = center + (radius + 15) * math.sin(label['angle'])
+            x_tick, y_tick = label['tick_end']
             svg_lines.append(f'  <line x1="{x_tick:.1f}" y1="{y_tick:.1f}" '
                            f'x2="{lx:.1f}" y2="{ly:.1f}" '
                            f'stroke="{label["color"]}" stroke-width="0.5" '
@@ -269,7 +305,7 @@ def render_plasmid_map(
         
         # Add overhang badge if enabled
         if show_overhangs and len(label['enzymes']) == 1:
-            overhang = label['enzymes'][0]['overhang_type']
+            overhang = label['enzymes'][0].overhang_type
             badge_map = {"5' overhang": "5'", "3' overhang": "3'", "Blunt": "B"}
             badge_text = badge_map.get(overhang, "?")
             svg_lines.append(f'  <text x="{lx:.1f}" y="{ly + 12:.1f}" '
@@ -283,7 +319,7 @@ def render_plasmid_map(
 
 def render_linear_map(
     L: int,
-    cuts: List[Dict],
+    cuts: List[CutEvent],
     *,
     title: str = "Restriction Map",
     width: int = 900,
@@ -298,7 +334,7 @@ def render_linear_map(
     
     Args:
         L: DNA length in bp
-        cuts: List of cut dictionaries
+        cuts: List of CutEvent records
         title: Map title
         width: SVG width in pixels
         height: SVG height in pixels
@@ -367,7 +403,7 @@ def render_linear_map(
     # Group cuts by position for collision detection
     cuts_by_pos = {}
     for cut in cuts:
-        pos = cut['pos']
+        pos = cut.pos
         if pos not in cuts_by_pos:
             cuts_by_pos[pos] = []
         cuts_by_pos[pos].append(cut)
@@ -379,7 +415,7 @@ def render_linear_map(
     for pos in cut_positions:
         enzymes_at_pos = cuts_by_pos[pos]
         x = margin_x + (pos / L * ruler_width)
-        color = _hash_color(enzymes_at_pos[0]['enzyme'])
+        color = _hash_color(enzymes_at_pos[0].enzyme)
         
         # Determine row (alternate top/bottom)
         row = 0
@@ -395,14 +431,14 @@ def render_linear_map(
         
         # Build label
         if len(enzymes_at_pos) > 1:
-            label_text = " • ".join([e['enzyme'] for e in enzymes_at_pos])
+            label_text = " • ".join([e.enzyme for e in enzymes_at_pos])
         else:
             enzyme = enzymes_at_pos[0]
-            parts = [enzyme['enzyme']]
+            parts = [enzyme.enzyme]
             if show_sites:
-                parts.append(f"({enzyme['site']})")
+                parts.append(f"({enzyme.site})")
             if show_overhangs:
-                overhang = enzyme['overhang_type']
+                overhang = enzyme.overhang_type
                 badge_map = {"5' overhang": "5'", "3' overhang": "3'", "Blunt": "B"}
                 badge = badge_map.get(overhang, "?")
                 parts.append(f"[{badge}]")
@@ -567,29 +603,72 @@ def render_fragment_diagram(
     return '\n'.join(svg_lines)
 
 
-def svg_to_png(svg: str, out_path: str, *, scale: float = 2.0) -> None:
+def _minify_tag(match: re.Match) -> str:
+    """Round long decimals and drop default attributes within one tag."""
+    tag = _SVG_LONG_DECIMAL.sub(lambda m: f"{float(m.group(0)):.2f}", match.group(0))
+    return _SVG_DEFAULT_ATTRS.sub("", tag)
+
+
+def minify_svg(svg: str) -> str:
     """
-    Convert SVG string to PNG file.
+    Minify an SVG document.
+    
+    Strips whitespace between tags. Inside tags, rounds decimals longer than
+    two places and drops empty style attributes and default stroke widths.
+    Text content is left untouched; coordinates move by at most 0.005 px.
     
     Args:
         svg: SVG string content
+        
+    Returns:
+        Minified SVG string
+    """
+    svg = _SVG_INTERTAG_WS.sub("><", svg)
+    return _SVG_TAG.sub(_minify_tag, svg)
+
+
+def _load_cairosvg():
+    """
+    Import cairosvg on first use and reuse the module (or the failure) afterwards.
+    
+    Raises:
+        ImportError: If cairosvg is not installed
+        OSError: If the cairo shared library cannot be loaded
+    """
+    global _cairosvg, _cairosvg_error
+    if _cairosvg is None and _cairosvg_error is None:
+        try:
+            import cairosvg
+            _cairosvg = cairosvg
+        except ImportError:
+            _cairosvg_error = ImportError(
+                "cairosvg is required for PNG export. Install it with:\n"
+                "  pip install cairosvg\n"
+                "Note: cairosvg requires cairo library to be installed on your system."
+            )
+        except OSError as e:
+            _cairosvg_error = e
+    if _cairosvg_error is not None:
+        raise _cairosvg_error
+    return _cairosvg
+
+
+def svg_to_png(svg: Union[str, bytes], out_path: str, *, scale: float = 2.0) -> None:
+    """
+    Convert SVG string to PNG file.
+    
+    Args:
+        svg: SVG content, as a string or already UTF-8 encoded bytes
         out_path: Output PNG file path
         scale: Scaling factor for resolution (default 2.0 for high-DPI)
         
     Raises:
         ImportError: If cairosvg is not installed
+        OSError: If the cairo shared library cannot be loaded
     """
-    try:
-        import cairosvg
-    except ImportError:
-        raise ImportError(
-            "cairosvg is required for PNG export. Install it with:\n"
-            "  pip install cairosvg\n"
-            "Note: cairosvg requires cairo library to be installed on your system."
-        )
-    
+    cairosvg = _load_cairosvg()
     cairosvg.svg2png(
-        bytestring=svg.encode('utf-8'),
+        bytestring=svg if isinstance(svg, bytes) else svg.encode('utf-8'),
         write_to=out_path,
         scale=scale
     )
@@ -5,8 +5,10 @@ Analyzes sticky-end compatibility between fragment ends produced by restriction
 Supports theoretical analysis based on enzyme metadata without sequence digests.
 """
 
-from typing import List, Tuple, Dict, NamedTuple, Any
+from typing import List, Tuple, Dict, NamedTuple, Any, Iterable, Iterator, Optional, TextIO
 import json
+import sys
+from exporters import WRITE_BUFFER_SIZE
 
 
 # ============================================================================
@@ -364,26 +366,25 @@ def format_pairs_output(results: List[CompatibilityResult]) -> str:
     return "\n".join(lines)
 
 
-def format_matrix_output(results: List[CompatibilityResult], all_ends: List[EndInfo]) -> str:
+def _iter_matrix_lines(results: List[CompatibilityResult], all_ends: List[EndInfo]) -> Iterator[str]:
     """
-    Format compatibility results as a matrix.
+    Yield the lines of the compatibility matrix report one at a time.
     
     Args:
         results: List of CompatibilityResult objects
         all_ends: All fragment ends for the matrix
         
-    Returns:
-        Formatted string
+    Yields:
+        Report lines without trailing newlines
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("LIGATION COMPATIBILITY ANALYSIS - COMPATIBILITY MATRIX")
-    lines.append("=" * 80)
-    lines.append("")
+    yield "=" * 80
+    yield "LIGATION COMPATIBILITY ANALYSIS - COMPATIBILITY MATRIX"
+    yield "=" * 80
+    yield ""
     
     if not all_ends:
-        lines.append("No ends to display.")
-        return "\n".join(lines)
+        yield "No ends to display."
+        return
     
     # Build compatibility lookup
     compat_lookup = set()
@@ -401,13 +402,12 @@ def format_matrix_output(results: List[CompatibilityResult], all_ends: List[EndI
         end_labels.append(label)
     
     # Print header
-    header = "    " + " ".join(f"{label:>4}" for label in end_labels)
-    lines.append(header)
-    lines.append("    " + "-" * (5 * len(end_labels)))
+    yield "    " + " ".join(f"{label:>4}" for label in end_labels)
+    yield "    " + "-" * (5 * len(end_labels))
     
-    # Print matrix
+    # Print matrix, one row at a time
     for i, end_i in enumerate(all_ends):
-        row = f"{end_labels[i]:<4}"
+        cells = [f"{end_labels[i]:<4}"]
         for j, end_j in enumerate(all_ends):
             if i == j:
                 # Same end
@@ -420,20 +420,51 @@ def format_matrix_output(results: List[CompatibilityResult], all_ends: List[EndI
                     cell = "  • " if is_blunt else "  ✓ "
                 else:
                     cell = "  . "
-            row += cell
-        lines.append(row)
+            cells.append(cell)
+        yield "".join(cells)
+    
+    yield ""
+    yield "Legend:"
+    yield "  ✓  = compatible (sticky ends)"
+    yield "  •  = compatible (blunt ends)"
+    yield "  .  = incompatible"
+    yield "  ·  = same end"
+    yield ""
+    yield f"Total compatible pairs: {len(results)}"
+    yield ""
+
+
+def format_matrix_output(results: List[CompatibilityResult], all_ends: List[EndInfo]) -> str:
+    """
+    Format compatibility results as a matrix.
     
-    lines.append("")
-    lines.append("Legend:")
-    lines.append("  ✓  = compatible (sticky ends)")
-    lines.append("  •  = compatible (blunt ends)")
-    lines.append("  .  = incompatible")
-    lines.append("  ·  = same end")
-    lines.append("")
-    lines.append(f"Total compatible pairs: {len(results)}")
-    lines.append("")
+    Args:
+        results: List of CompatibilityResult objects
+        all_ends: All fragment ends for the matrix
+        
+    Returns:
+        Formatted string
+    """
+    return "\n".join(_iter_matrix_lines(results, all_ends))
+
+
+def write_matrix_output(results: List[CompatibilityResult], all_ends: List[EndInfo],
+                        file: Optional[TextIO] = None) -> None:
+    """
+    Write the compatibility matrix row by row instead of building one string.
     
-    return "\n".join(lines)
+    Produces the same text as print(format_matrix_output(...)).
+    
+    Args:
+        results: List of CompatibilityResult objects
+        all_ends: All fragment ends for the matrix
+        file: Text stream to write to (default sys.stdout)
+    """
+    if file is None:
+        file = sys.stdout
+    for line in _iter_matrix_lines(results, all_ends):
+        file.write(line)
+        file.write("\n")
 
 
 def format_detailed_output(results: List[CompatibilityResult]) -> str:
@@ -483,48 +514,78 @@ def format_detailed_output(results: List[CompatibilityResult]) -> str:
     return "\n".join(lines)
 
 
-def export_to_json(results: List[CompatibilityResult], output_path: str) -> None:
+def compatibility_result_to_dict(result: CompatibilityResult) -> Dict[str, Any]:
     """
-    Export compatibility results to JSON file.
+    Convert a single CompatibilityResult to its JSON-ready form.
     
     Args:
-        results: List of CompatibilityResult objects
+        result: CompatibilityResult object
+        
+    Returns:
+        Dictionary with both ends' details and the compatibility flags
+    """
+    return {
+        "end_a": {
+            "fragment_id": result.end_a.fragment_id,
+            "polarity": result.end_a.polarity,
+            "enzyme": result.end_a.enzyme,
+            "overhang_type": result.end_a.overhang_type,
+            "overhang_len": result.end_a.overhang_len,
+            "sticky_seq": result.end_a.sticky_seq,
+            "gc_percent": result.gc_percent_a,
+            "tm": result.tm_a,
+            "position": result.end_a.position
+        },
+        "end_b": {
+            "fragment_id": result.end_b.fragment_id,
+            "polarity": result.end_b.polarity,
+            "enzyme": result.end_b.enzyme,
+            "overhang_type": result.end_b.overhang_type,
+            "overhang_len": result.end_b.overhang_len,
+            "sticky_seq": result.end_b.sticky_seq,
+            "gc_percent": result.gc_percent_b,
+            "tm": result.tm_b,
+            "position": result.end_b.position
+        },
+        "compatible": result.compatible,
+        "directional": result.directional,
+        "note": result.note
+    }
+
+
+def _write_json_array(entries: Iterable[Dict[str, Any]], output_path: str) -> None:
+    """
+    Stream dictionaries to a JSON array file one entry at a time.
+    
+    The full list is never materialized; the file layout matches
+    json.dump(..., indent=2) of the equivalent list.
+    
+    Args:
+        entries: Iterable of JSON-serializable dictionaries
         output_path: Path to output JSON file
     """
-    json_data = []
-    
-    for result in results:
-        entry = {
-            "end_a": {
-                "fragment_id": result.end_a.fragment_id,
-                "polarity": result.end_a.polarity,
-                "enzyme": result.end_a.enzyme,
-                "overhang_type": result.end_a.overhang_type,
-                "overhang_len": result.end_a.overhang_len,
-                "sticky_seq": result.end_a.sticky_seq,
-                "gc_percent": result.gc_percent_a,
-                "tm": result.tm_a,
-                "position": result.end_a.position
-            },
-            "end_b": {
-                "fragment_id": result.end_b.fragment_id,
-                "polarity": result.end_b.polarity,
-                "enzyme": result.end_b.enzyme,
-                "overhang_type": result.end_b.overhang_type,
-                "overhang_len": result.end_b.overhang_len,
-                "sticky_seq": result.end_b.sticky_seq,
-                "gc_percent": result.gc_percent_b,
-                "tm": result.tm_b,
-                "position": result.end_b.position
-            },
-            "compatible": result.compatible,
-            "directional": result.directional,
-            "note": result.note
-        }
-        json_data.append(entry)
+    with open(output_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+        separator = "[\n  "
+        for entry in entries:
+            f.write(separator)
+            f.write(json.dumps(entry, indent=2).replace("\n", "\n  "))
+            separator = ",\n  "
+        
+        # No entries written: emit an empty array
+        f.write("[]" if separator == "[\n  " else "\n]")
+
+
+def export_to_json(results: Iterable[CompatibilityResult], output_path: str) -> None:
+    """
+    Export compatibility results to JSON file.
     
-    with open(output_path, 'w') as f:
-        json.dump(json_data, f, indent=2)
+    Results are encoded and written one at a time through a buffered stream.
+    
+    Args:
+        results: Iterable of CompatibilityResult objects
+        output_path: Path to output JSON file
+    """
+    _write_json_array((compatibility_result_to_dict(r) for r in results), output_path)
 
 
 # ============================================================================
@@ -709,9 +770,29 @@ def calculate_theoretical_compatibility(
     """
     results = []
     
+    # Ends can only be compatible when both are blunt, or when they share
+    # overhang type and length; bucket on that so cross-bucket pairs are never
+    # compared. Templates are not part of the key because IUPAC N matches any base.
+    buckets: Dict[Tuple[str, int], List[int]] = {}
+    for idx, end in enumerate(ends):
+        key = ("Blunt", 0) if end.k == 0 else (end.overhang_type, end.k)
+        buckets.setdefault(key, []).append(idx)
+    
+    # Each end's bucket and its position there, so pairs are still emitted in (i, j) order
+    bucket_slot: Dict[int, Tuple[List[int], int]] = {}
+    for members in buckets.values():
+        for pos, idx in enumerate(members):
+            bucket_slot[idx] = (members, pos)
+    
     for i in range(len(ends)):
-        for j in range(i + 1, len(ends)):
-            a = ends[i]
+        a = ends[i]
+        # Whole buckets that can never pass the blunt / minimum-overhang checks
+        if a.k == 0 and not include_blunt:
+            continue
+        if 0 < a.k < min_overhang:
+            continue
+        members, pos = bucket_slot[i]
+        for j in members[pos + 1:]:
             b = ends[j]
             
             # Check compatibility
@@ -874,26 +955,62 @@ def format_theoretical_detailed(
     if not results:
         return "[]"
     
-    output = []
-    for a, b, directional, reason in results:
-        entry = {
-            "enzyme_a": a.enzyme,
-            "enzyme_b": b.enzyme,
-            "overhang_type": a.overhang_type,
-            "k": a.k,
-            "template_a": a.sticky_template,
-            "template_b": b.sticky_template,
-            "compatible": True,
-            "directional": directional,
-            "reason": reason,
-            "palindromic_a": a.is_palindromic,
-            "palindromic_b": b.is_palindromic
-        }
-        output.append(entry)
+    output = [theoretical_result_to_dict(*result) for result in results]
     
     return json.dumps(output, indent=2)
 
 
+def theoretical_result_to_dict(
+    a: TheoreticalEnd,
+    b: TheoreticalEnd,
+    directional: bool,
+    reason: str
+) -> Dict[str, Any]:
+    """
+    Convert a single theoretical compatibility tuple to its JSON-ready form.
+    
+    Args:
+        a: First TheoreticalEnd
+        b: Second TheoreticalEnd
+        directional: Whether the pair is directional
+        reason: Compatibility reason string
+        
+    Returns:
+        Dictionary with enzyme names, templates and compatibility flags
+    """
+    return {
+        "enzyme_a": a.enzyme,
+        "enzyme_b": b.enzyme,
+        "overhang_type": a.overhang_type,
+        "k": a.k,
+        "template_a": a.sticky_template,
+        "template_b": b.sticky_template,
+        "compatible": True,
+        "directional": directional,
+        "reason": reason,
+        "palindromic_a": a.is_palindromic,
+        "palindromic_b": b.is_palindromic
+    }
+
+
+def export_theoretical_to_json(
+    results: Iterable[Tuple[TheoreticalEnd, TheoreticalEnd, bool, str]],
+    output_path: str
+) -> None:
+    """
+    Stream theoretical compatibility results to a JSON file.
+    
+    Entries are encoded and written one at a time, so the O(N²) list of
+    pair dictionaries is never materialized. The file layout matches
+    json.dump(..., indent=2) of the equivalent list.
+    
+    Args:
+        results: Iterable of compatibility tuples (end_a, end_b, directional, reason)
+        output_path: Path to output JSON file
+    """
+    _write_json_array((theoretical_result_to_dict(*r) for r in results), output_path)
+
+
 # ============================================================================
 # ENZYME PAIR ANALYSIS (THEORETICAL) - LEGACY
 # ============================================================================
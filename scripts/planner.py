@@ -10,7 +10,7 @@ import hashlib
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, FrozenSet
 
-from fragment_calculator import compute_fragments_with_sequences, Fragment
+from fragment_calculator import compute_fragments_with_sequences, Fragment, CutMeta
 from ligation_compatibility import (
     are_compatible, EndInfo
 )
@@ -307,12 +307,12 @@ def simulate_digest(construct: Construct, enzymes: List[str],
         for pos in cuts:
             if pos not in cut_metadata:
                 cut_metadata[pos] = []
-            cut_metadata[pos].append({
-                'enzyme': enzyme_name,
-                'site': enzyme_info['sequence'],
-                'cut_index': enzyme_info['cut_index'],
-                'overhang_type': enzyme_info.get('overhang_type', 'Unknown')
-            })
+            cut_metadata[pos].append(CutMeta(
+                enzyme=enzyme_name,
+                site=enzyme_info['sequence'],
+                cut_index=enzyme_info['cut_index'],
+                overhang_type=enzyme_info.get('overhang_type', 'Unknown')
+            ))
     
     # Remove duplicates and sort
     all_cuts = sorted(set(all_cuts))
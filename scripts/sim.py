@@ -7,24 +7,38 @@ Supports multiple enzymes for combined digest analysis and circular topology.
 
 import argparse
 import json
+import logging
 import re
 import sys
 import unicodedata
-from typing import List, Dict, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional
 from fragment_calculator import (
     compute_fragments, validate_fragment_total, build_restriction_map, simulate_gel,
     compute_fragments_with_sequences, elide_sequence, extract_fragment_ends_for_ligation,
-    compute_end_metadata
+    compute_end_metadata, CutMeta, CutEvent, EndInfo
 )
-from gel_ladders import get_ladder
-from graphics import render_plasmid_map, render_linear_map, render_fragment_diagram, svg_to_png
+from gel_ladders import get_ladder_tuple
+from graphics import render_plasmid_map, render_linear_map, render_fragment_diagram, svg_to_png, minify_svg
 from ligation_compatibility import (
-    calculate_compatibility, format_pairs_output, format_matrix_output,
+    calculate_compatibility, format_pairs_output, write_matrix_output,
     format_detailed_output, export_to_json,
     theoretical_end_from_enzyme, calculate_theoretical_compatibility,
-    format_theoretical_pairs, format_theoretical_matrix, format_theoretical_detailed
+    format_theoretical_pairs, format_theoretical_matrix, format_theoretical_detailed,
+    export_theoretical_to_json
 )
-from exporters import export_genbank, export_csv
+from exporters import export_genbank, export_csv, Cut, WRITE_BUFFER_SIZE
+
+# Diagnostics for handled errors; tracebacks are logged at DEBUG so default runs
+# print only the user-facing message
+logger = logging.getLogger("genomancer")
+
+# orjson is an optional accelerator for --lanes-config parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # IUPAC degenerate base mapping
 IUPAC = {
@@ -34,6 +48,49 @@ IUPAC = {
     "H": "[ACT]", "V": "[ACG]", "N": "[ACGT]"
 }
 
+# str.translate table expanding IUPAC letters in one C-level pass, and the
+# full-site check run before it
+_IUPAC_TABLE = str.maketrans(IUPAC)
+_VALID_SITE = re.compile(r"[ACGTRYWSMKNBDHV]*")
+
+# Deletion table for enzyme-name normalization (spaces and hyphens)
+_NAME_SEPARATORS = str.maketrans("", "", " -")
+
+# Number of FASTA records assembled before each batched write
+FASTA_BATCH_RECORDS = 256
+
+# FASTA header templates (%-formatted once per fragment / fragment end)
+FASTA_HEADER_FMT = ">frag_%03d|len=%d|start=%d|end=%d|left=%s|right=%s"
+FASTA_OVERHANG_END_FMT = "%s:%sp:%d:%s"
+FASTA_BLUNT_END_FMT = "%s:blunt:0"
+
+# Compiled lookahead patterns keyed by recognition site (shared across enzymes and lanes)
+_SITE_PATTERNS: Dict[str, re.Pattern] = {}
+
+# Combined single-scan patterns keyed by the tuple of recognition sites
+_MULTI_SITE_PATTERNS: Dict[Tuple[str, ...], re.Pattern] = {}
+
+
+def _json_loads(data):
+    """
+    Parse JSON text or bytes, using orjson when it is installed.
+    
+    Invalid input is re-parsed with json.loads, so the json.JSONDecodeError
+    shown to the user carries the same message and position either way.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 def iupac_to_regex(site: str) -> str:
     """
@@ -48,15 +105,66 @@ def iupac_to_regex(site: str) -> str:
     Raises:
         ValueError: If site contains invalid characters
     """
-    allowed_chars = set("ACGT") | set("RYWSMKNBDHV")
     site_upper = site.upper()
     
-    for char in site_upper:
-        if char not in allowed_chars:
-            raise ValueError(f"Invalid character '{char}' in recognition site '{site}'. "
-                           f"Allowed characters: A,C,G,T,R,Y,W,S,M,K,B,D,H,V,N")
+    if not _VALID_SITE.fullmatch(site_upper):
+        # Error path only: locate the first offending character for the message
+        char = next(ch for ch in site_upper if ch not in IUPAC)
+        raise ValueError(f"Invalid character '{char}' in recognition site '{site}'. "
+                       f"Allowed characters: A,C,G,T,R,Y,W,S,M,K,B,D,H,V,N")
     
-    return "".join(IUPAC[ch] for ch in site_upper)
+    return site_upper.translate(_IUPAC_TABLE)
+
+
+def compile_site_pattern(site: str) -> re.Pattern:
+    """
+    Get the compiled overlapping-match pattern for a recognition site.
+    
+    Patterns are compiled once per site and cached, so repeated scans for the
+    same enzyme (multiple lanes, isoschizomers) skip IUPAC expansion and compilation.
+    
+    Args:
+        site: Recognition site string that may contain IUPAC letters
+        
+    Returns:
+        Compiled regex with a lookahead so overlapping sites are all reported
+        
+    Raises:
+        ValueError: If site contains invalid characters
+    """
+    pattern = _SITE_PATTERNS.get(site)
+    if pattern is None:
+        pattern = re.compile(f"(?={iupac_to_regex(site)})", flags=re.IGNORECASE)
+        _SITE_PATTERNS[site] = pattern
+    return pattern
+
+
+def compile_multi_site_pattern(sites: Tuple[str, ...]) -> re.Pattern:
+    """
+    Get a compiled pattern that reports every site matching at each position.
+    
+    A leading lookahead alternation stops the scan only where at least one site
+    matches; an optional lookahead group per site (group i + 1 for sites[i])
+    then records which of them match there, so overlapping and coincident
+    sites are all reported from a single pass over the sequence.
+    
+    Args:
+        sites: Recognition site strings that may contain IUPAC letters
+        
+    Returns:
+        Compiled regex with one capture group per site
+        
+    Raises:
+        ValueError: If any site contains invalid characters
+    """
+    pattern = _MULTI_SITE_PATTERNS.get(sites)
+    if pattern is None:
+        expanded = [iupac_to_regex(site) for site in sites]
+        any_site = "|".join(expanded)
+        per_site = "".join(f"(?:(?=({regex})))?" for regex in expanded)
+        pattern = re.compile(f"(?=(?:{any_site})){per_site}", flags=re.IGNORECASE)
+        _MULTI_SITE_PATTERNS[sites] = pattern
+    return pattern
 
 
 def normalize(name: str) -> str:
@@ -75,7 +183,7 @@ def normalize(name: str) -> str:
     normalized = ''.join(c for c in normalized if not unicodedata.combining(c))
     
     # Convert to lowercase and remove whitespace/hyphens
-    normalized = normalized.lower().replace(' ', '').replace('-', '')
+    normalized = normalized.lower().translate(_NAME_SEPARATORS)
     
     return normalized
 
@@ -261,9 +369,8 @@ def find_cut_sites(
     break_positions = []
     seq_len = len(dna_sequence)
     
-    # Convert IUPAC site to regex pattern and compile with lookahead for overlapping matches
-    regex_pattern = f"(?={iupac_to_regex(enzyme_sequence)})"
-    pattern = re.compile(regex_pattern, flags=re.IGNORECASE)
+    # Cached IUPAC-expanded pattern with lookahead for overlapping matches
+    pattern = compile_site_pattern(enzyme_sequence)
     
     # Find all overlapping matches
     for match in pattern.finditer(dna_sequence):
@@ -285,6 +392,53 @@ def find_cut_sites(
     return break_positions
 
 
+def find_cut_sites_multi(
+    dna_sequence: str, sites: List[Tuple[str, int]], circular: bool = False
+) -> List[List[int]]:
+    """
+    Find the cut sites of several enzymes with one scan of the DNA sequence.
+    
+    Equivalent to calling find_cut_sites once per (site, cut_index) pair, but
+    the sequence is traversed once instead of once per enzyme.
+    
+    Args:
+        dna_sequence: The DNA sequence to search
+        sites: (recognition site, cut_index) pairs, one per enzyme
+        circular: If True, wrap cut positions using modulo for circular DNA
+        
+    Returns:
+        List of break position lists, in the same order as sites
+    """
+    if len(sites) == 1:
+        site, cut_index = sites[0]
+        return [find_cut_sites(dna_sequence, site, cut_index, circular=circular)]
+    
+    break_positions = [[] for _ in sites]
+    if not sites:
+        return break_positions
+    
+    seq_len = len(dna_sequence)
+    cut_indices = [cut_index for _, cut_index in sites]
+    pattern = compile_multi_site_pattern(tuple(site for site, _ in sites))
+    
+    for match in pattern.finditer(dna_sequence):
+        start = match.start()
+        for i, group in enumerate(match.groups()):
+            if group is None:
+                continue
+            break_pos = start + cut_indices[i]
+            
+            # Same wrapping / range rules as find_cut_sites
+            if circular:
+                break_pos = break_pos % seq_len
+            elif break_pos < 0 or break_pos > seq_len:
+                continue
+            
+            break_positions[i].append(break_pos)
+    
+    return break_positions
+
+
 def calculate_fragments(
     dna_sequence: str, cut_positions: List[int]
 ) -> List[Tuple[str, int]]:
@@ -387,17 +541,21 @@ def fragments_linear(seq_len: int, cuts: List[int]) -> List[int]:
     return fragment_lengths
 
 
-def find_closest_enzyme_names(requested_name: str, available_names: List[str], max_distance: int = 2) -> List[str]:
+@lru_cache(maxsize=128)
+def find_closest_enzyme_names(requested_name: str, available_names: Tuple[str, ...],
+                              max_distance: int = 2) -> Tuple[str, ...]:
     """
     Find enzyme names that are similar to the requested name.
     
+    Results are memoized, so available_names must be hashable (a tuple).
+    
     Args:
         requested_name: The name that was requested
-        available_names: List of available enzyme names
+        available_names: Tuple of available enzyme names
         max_distance: Maximum edit distance for similarity
         
     Returns:
-        List of similar enzyme names
+        Tuple of similar enzyme names
     """
     def edit_distance(s1: str, s2: str) -> int:
         """Calculate edit distance between two strings."""
@@ -427,7 +585,7 @@ def find_closest_enzyme_names(requested_name: str, available_names: List[str], m
         
         # Check exact match (case-insensitive)
         if name_lower == requested_lower:
-            return [name]
+            return (name,)
         
         # Check if it's a substring match
         if requested_lower in name_lower or name_lower in requested_lower:
@@ -436,11 +594,111 @@ def find_closest_enzyme_names(requested_name: str, available_names: List[str], m
         elif distance <= max_distance:
             similar_names.append(name)
     
-    return similar_names[:5]  # Return top 5 matches
+    return tuple(similar_names[:5])  # Return top 5 matches
+
+
+def fasta_end_label(end: Optional[EndInfo], default: str) -> str:
+    """
+    Format one fragment end for a FASTA header.
+    
+    Args:
+        end: EndInfo for the fragment end, or None at a sequence boundary
+        default: Label used when there is no cut at this end ("START" or "END")
+        
+    Returns:
+        "enzyme:5p:len:bases" for overhangs, "enzyme:blunt:0" for blunt ends, else default
+    """
+    if end is None:
+        return default
+    if end.overhang_len > 0:
+        return FASTA_OVERHANG_END_FMT % (end.enzyme, end.overhang_type[0], end.overhang_len, end.end_bases)
+    return FASTA_BLUNT_END_FMT % end.enzyme
+
+
+def report_error(message: str) -> None:
+    """
+    Report a recoverable error and log the traceback of the exception being handled.
+    
+    The message is printed to stdout with the rest of the CLI output. The traceback
+    is logged at DEBUG on the module logger, so it only appears when a caller that
+    embeds main() enables debug logging.
+    
+    Args:
+        message: Error line to print
+    """
+    print(message)
+    logger.debug("Traceback for: %s", message, exc_info=True)
 
 
-def main():
-    """Main function to run the restriction enzyme simulator."""
+def build_export_cuts(
+    dna_sequence: str,
+    sorted_cuts: List[int],
+    cut_metadata: Dict[int, List[CutMeta]],
+    circular: bool = False
+) -> List[Cut]:
+    """
+    Build the per-enzyme cut rows consumed by the GenBank and CSV exporters.
+    
+    Args:
+        dna_sequence: The DNA sequence
+        sorted_cuts: Sorted list of cut positions
+        cut_metadata: Dictionary mapping cut position to list of CutMeta records
+        circular: Whether the sequence is circular
+        
+    Returns:
+        List of Cut records, one per enzyme per cut position
+    """
+    # No cuts, or no enzyme metadata at any cut: nothing to export
+    if not sorted_cuts or not any(cut_metadata.values()):
+        return []
+    
+    export_cuts = []
+    # overhang_len depends only on the enzyme's site, cut index and overhang type,
+    # so it is computed once per distinct enzyme rather than once per cut
+    overhang_lens: Dict[Tuple[str, int, str], int] = {}
+    for pos in sorted_cuts:
+        enzymes_at_pos = cut_metadata.get(pos, [])
+        for enz_meta in enzymes_at_pos:
+            key = (enz_meta.site, enz_meta.cut_index, enz_meta.overhang_type)
+            overhang_len = overhang_lens.get(key)
+            if overhang_len is None:
+                # Use centralized function to compute overhang metadata
+                end_meta = compute_end_metadata(
+                    dna=dna_sequence,
+                    cut_pos=pos,
+                    recognition_site=enz_meta.site,
+                    cut_index=enz_meta.cut_index,
+                    overhang_type=enz_meta.overhang_type,
+                    is_left_end=True,  # Doesn't matter for just getting length
+                    circular=circular
+                )
+                overhang_len = overhang_lens[key] = end_meta['overhang_len']
+            
+            export_cuts.append(Cut(
+                pos=pos,
+                enzyme=enz_meta.enzyme,
+                recognition_site=enz_meta.site,
+                cut_index=enz_meta.cut_index,
+                overhang_type=enz_meta.overhang_type,
+                overhang_len=overhang_len
+            ))
+    
+    return export_cuts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main function to run the restriction enzyme simulator.
+    
+    Returns an exit status instead of calling sys.exit, so the simulator can be
+    driven repeatedly from one warm interpreter.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        
+    Returns:
+        Process exit status (0 on success)
+    """
     # Set up command-line argument parsing
     parser = argparse.ArgumentParser(
         description="Restriction Enzyme Simulator - Phase 3 (Linear and Circular DNA)",
@@ -716,7 +974,7 @@ Examples:
         help="Include simulated gels for each step in plan output"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # Load enzyme database first (needed for all modes)
@@ -740,7 +998,7 @@ Examples:
                 )
             except ImportError as e:
                 print(f"Error: Could not import planner modules: {e}")
-                sys.exit(1)
+                return 1
             
             # Load specification
             print(f"Loading cloning specification: {args.plan_cloning}")
@@ -748,13 +1006,13 @@ Examples:
                 spec = load_json_or_yaml(args.plan_cloning)
             except (FileNotFoundError, ValueError) as e:
                 print(f"Error loading spec: {e}")
-                sys.exit(1)
+                return 1
             
             # Validate specification
             valid, error_msg = validate_spec(spec)
             if not valid:
                 print(f"Error: Invalid specification - {error_msg}")
-                sys.exit(1)
+                return 1
             
             print("✓ Specification loaded and validated")
             print()
@@ -805,7 +1063,7 @@ Examples:
                 print("  - Increase --max-steps to allow more complex strategies")
                 print("  - Relax constraints in the specification")
                 print("  - Check that enzymes cut at appropriate sites")
-                sys.exit(1)
+                return 1
             
             print("✓ Plan found!")
             print()
@@ -833,12 +1091,12 @@ Examples:
                 # Also export JSON representation
                 import os
                 json_path = os.path.join(args.export_plan, "plan.json")
-                with open(json_path, 'w') as f:
+                with open(json_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
                     f.write(format_plan_json(plan))
                 print(f"✓ Plan JSON saved to: {json_path}")
             
             # Exit after planning
-            sys.exit(0)
+            return 0
         
         # ====================================================================
         # THEORETICAL COMPATIBILITY MODE (no sequence required)
@@ -910,29 +1168,11 @@ Examples:
             
             # Save JSON output if requested
             if args.json_out:
-                json_data = []
-                for a, b, directional, reason in results:
-                    entry = {
-                        "enzyme_a": a.enzyme,
-                        "enzyme_b": b.enzyme,
-                        "overhang_type": a.overhang_type,
-                        "k": a.k,
-                        "template_a": a.sticky_template,
-                        "template_b": b.sticky_template,
-                        "compatible": True,
-                        "directional": directional,
-                        "reason": reason,
-                        "palindromic_a": a.is_palindromic,
-                        "palindromic_b": b.is_palindromic
-                    }
-                    json_data.append(entry)
-                
-                with open(args.json_out, 'w') as f:
-                    json.dump(json_data, f, indent=2)
+                export_theoretical_to_json(results, args.json_out)
                 print(f"\n✓ Results saved to: {args.json_out}")
             
             # Exit after theoretical analysis
-            sys.exit(0)
+            return 0
         
         # ====================================================================
         # REGULAR DIGEST MODE (requires sequence)
@@ -942,14 +1182,14 @@ Examples:
         if not args.seq:
             print("Error: --seq is required for digest mode.")
             print("For theoretical compatibility without a sequence, use --theoretical-enzymes or --theoretical-all")
-            sys.exit(2)
+            return 2
         
         # Allow --lanes-config without --enz if lanes define their own enzymes
         if not args.enz and not args.lanes_config:
             print("Error: No enzymes specified.")
             print("Usage: python sim.py --seq <sequence> --enz <enzyme1> [enzyme2] ...")
             print("Or use --lanes-config to define enzymes per lane")
-            sys.exit(2)
+            return 2
 
         # Create normalized lookup dictionary for case-insensitive matching
         normalized_lookup = {}
@@ -959,12 +1199,9 @@ Examples:
                 normalized_lookup[norm_name] = []
             normalized_lookup[norm_name].append(name)
         
-        available_names = list(ENZYMES.keys())
-
         # Validate and normalize enzyme names, handling duplicates
         validated_enzymes = []
         validated_display_names = []
-        enzyme_count = {}  # Track how many times each enzyme appears
         
         # Only validate enzymes if --enz was provided
         if args.enz:
@@ -975,21 +1212,16 @@ Examples:
                     if len(variants) == 1:
                         actual_enzyme = variants[0]
                         validated_enzymes.append(actual_enzyme)
-                        
-                        # Track duplicate count (for display names)
-                        if actual_enzyme not in enzyme_count:
-                            enzyme_count[actual_enzyme] = 1
-                        else:
-                            enzyme_count[actual_enzyme] += 1
                     else:
                         # Ambiguous base name - show variants and exit
                         print(f"Error: Multiple enzyme variants found for '{enzyme_name}':")
                         for variant in variants:
                             print(f"  - {variant}")
                         print("Please specify the exact enzyme name with suffix if needed.")
-                        sys.exit(2)
+                        return 2
                 else:
-                    # Find closest matches
+                    # Find closest matches (name lists are only built on this error path)
+                    available_names = tuple(ENZYMES)
                     closest = find_closest_enzyme_names(enzyme_name, available_names)
                     print(f"Error: Enzyme '{enzyme_name}' not found in database.")
                     if closest:
@@ -998,18 +1230,22 @@ Examples:
                         print("No similar enzyme names found.")
                     print(f"Available enzymes: {', '.join(sorted(available_names))}")
                     print(f"Total enzymes available: {len(available_names)}")
-                    sys.exit(2)
-            
-            # Build a list of display names in order
-            validated_display_names = []
-            current_counts = {}
-            for enz in validated_enzymes:
-                if enz not in current_counts:
-                    current_counts[enz] = 1
-                    validated_display_names.append(enz)
-                else:
-                    current_counts[enz] += 1
-                    validated_display_names.append(f"{enz}#{current_counts[enz]}")
+                    return 2
+            
+            # Build a list of display names in order; duplicates get a "#n" suffix.
+            # Distinct enzymes (the common case) are their own display names.
+            if len(set(validated_enzymes)) == len(validated_enzymes):
+                validated_display_names = list(validated_enzymes)
+            else:
+                validated_display_names = []
+                current_counts = {}
+                for enz in validated_enzymes:
+                    if enz not in current_counts:
+                        current_counts[enz] = 1
+                        validated_display_names.append(enz)
+                    else:
+                        current_counts[enz] += 1
+                        validated_display_names.append(f"{enz}#{current_counts[enz]}")
 
         # Read DNA sequence
         print(f"Reading DNA sequence from: {args.seq}")
@@ -1017,7 +1253,8 @@ Examples:
         
         if not dna_sequence:
             print("Error: Empty sequence after filtering.")
-            sys.exit(1)
+            return 1
+        seq_len = len(dna_sequence)
         
         # Display topology mode
         topology = "circular" if args.circular else "linear"
@@ -1027,17 +1264,25 @@ Examples:
         elif args.circular:
             print("Single-cut behavior: intact circle (yields 1 fragment)")
             
-        print(f"DNA sequence length: {len(dna_sequence)} bp")
+        print(f"DNA sequence length: {seq_len} bp")
         print(f"DNA sequence: {dna_sequence}")
         print()
 
         # Process each enzyme individually and collect cut metadata
         cuts_by_enzyme = {}
-        cut_metadata = {}  # Maps cut position -> list of enzyme metadata
+        cut_metadata = defaultdict(list)  # Maps cut position -> list of enzyme metadata
         
         # Only process enzymes if --enz was provided (not using lanes-config only)
         if validated_enzymes:
-            for enzyme_name, display_name in zip(validated_enzymes, validated_display_names):
+            # Scan the sequence once for all requested enzymes
+            site_cuts = find_cut_sites_multi(
+                dna_sequence,
+                [(ENZYMES[name]["sequence"], ENZYMES[name]["cut_index"]) for name in validated_enzymes],
+                circular=args.circular
+            )
+            for enzyme_name, display_name, break_positions in zip(
+                validated_enzymes, validated_display_names, site_cuts
+            ):
                 enzyme_info = ENZYMES[enzyme_name]
                 recognition_seq = enzyme_info["sequence"]
                 cut_index = enzyme_info["cut_index"]
@@ -1048,21 +1293,19 @@ Examples:
                 print(f"Cut @:  index {cut_index}")
                 print(f"Overhang: {overhang_type}")
                 
-                # Find cut positions for this enzyme
-                break_positions = find_cut_positions_linear(dna_sequence, enzyme_name, ENZYMES, circular=args.circular)
                 cuts_by_enzyme[display_name] = break_positions
                 
-                # Store metadata for each cut position with display name
+                # Store metadata for each cut position with display name.
+                # One record per enzyme is shared by all of its cuts (read-only downstream).
+                enzyme_meta = CutMeta(
+                    enzyme=display_name,  # Use display name for output
+                    site=recognition_seq,
+                    cut_index=cut_index,
+                    overhang_type=overhang_type,
+                    actual_enzyme=enzyme_name  # Keep actual enzyme for lookups
+                )
                 for pos in break_positions:
-                    if pos not in cut_metadata:
-                        cut_metadata[pos] = []
-                    cut_metadata[pos].append({
-                        'enzyme': display_name,  # Use display name for output
-                        'actual_enzyme': enzyme_name,  # Keep actual enzyme for lookups
-                        'site': recognition_seq,
-                        'cut_index': cut_index,
-                        'overhang_type': overhang_type
-                    })
+                    cut_metadata[pos].append(enzyme_meta)
                 
                 if break_positions:
                     print(f"Matches at positions: {', '.join(map(str, break_positions))}")
@@ -1071,16 +1314,21 @@ Examples:
                 print()
 
         # Merge all cut positions
-        all_cuts = merge_cut_positions(cuts_by_enzyme, len(dna_sequence))
+        all_cuts = merge_cut_positions(cuts_by_enzyme, seq_len)
+        # merge_cut_positions already returns a sorted list; reuse it everywhere
+        # a position-ordered walk is needed instead of re-sorting each time
+        sorted_cuts = all_cuts
         
         # Compute fragments using new calculator
         fragments = compute_fragments(
             cut_positions=all_cuts,
-            seq_len=len(dna_sequence),
+            seq_len=seq_len,
             circular=args.circular,
             circular_single_cut_linearizes=args.circular_single_cut_linearizes,
             cut_metadata=cut_metadata
         )
+        # Fragment sizes are shared by the length check and the gel lanes
+        digest_sizes = [f['length'] for f in fragments]
         
         # Compute fragments with sequences if requested
         fragments_with_seqs = None
@@ -1093,17 +1341,13 @@ Examples:
                 cut_metadata=cut_metadata
             )
         
-        # Build cut_events list for restriction map
-        cut_events = []
-        for pos in sorted(all_cuts):
-            enzymes_at_pos = cut_metadata.get(pos, [])
-            for enz_meta in enzymes_at_pos:
-                cut_events.append({
-                    'pos': pos,
-                    'enzyme': enz_meta['enzyme'],
-                    'site': enz_meta['site'],
-                    'overhang_type': enz_meta['overhang_type']
-                })
+        # Build the position-ordered cut events once; the cut-site details print,
+        # restriction map and SVG renderers all consume this list
+        cut_events = [
+            CutEvent(pos, enz_meta.enzyme, enz_meta.site, enz_meta.overhang_type)
+            for pos in sorted_cuts
+            for enz_meta in cut_metadata.get(pos, [])
+        ]
         
         # Display detailed fragment information (unless --print-map-only or --gel-only is set)
         if not args.print_map_only and not args.gel_only:
@@ -1111,10 +1355,10 @@ Examples:
             print("DIGESTION RESULTS")
             print("=" * 80)
             print(f"Mode: {topology}")
-            print(f"Sequence length: {len(dna_sequence)} bp")
+            print(f"Sequence length: {seq_len} bp")
             print(f"Total cuts: {len(all_cuts)}")
             if all_cuts:
-                print(f"Cut positions: {', '.join(map(str, sorted(all_cuts)))}")
+                print(f"Cut positions: {', '.join(map(str, sorted_cuts))}")
             print(f"Fragments generated: {len(fragments)}")
             print()
             
@@ -1125,6 +1369,8 @@ Examples:
             print(header)
             print("-" * 80)
             
+            # Rows are collected and written in one call rather than a print per fragment
+            rows = []
             for frag in fragments:
                 idx = frag['index']
                 start = frag['start']
@@ -1138,26 +1384,27 @@ Examples:
                 
                 if frag['boundaries']['left_cut'] is not None:
                     left_pos = frag['boundaries']['left_cut']['pos']
-                    left_enzymes = [e['enzyme'] for e in frag['boundaries']['left_cut']['enzymes']]
+                    left_enzymes = [e.enzyme for e in frag['boundaries']['left_cut']['enzymes']]
                     left_info = f"{left_pos}({','.join(left_enzymes) if left_enzymes else '?'})"
                 
                 if frag['boundaries']['right_cut'] is not None:
                     right_pos = frag['boundaries']['right_cut']['pos']
-                    right_enzymes = [e['enzyme'] for e in frag['boundaries']['right_cut']['enzymes']]
+                    right_enzymes = [e.enzyme for e in frag['boundaries']['right_cut']['enzymes']]
                     right_info = f"{right_pos}({','.join(right_enzymes) if right_enzymes else '?'})"
                 
                 boundary_str = f"{left_info} -> {right_info}"
                 
-                print(f"{idx:<8} {start:<8} {end:<8} {length:<10} {wraps:<8} {boundary_str}")
+                rows.append(f"{idx:<8} {start:<8} {end:<8} {length:<10} {wraps:<8} {boundary_str}")
             
-            print("-" * 80)
+            rows.append("-" * 80)
+            sys.stdout.write('\n'.join(rows) + '\n')
             
             # Verify total length
-            if not validate_fragment_total(fragments, len(dna_sequence)):
-                total = sum(f['length'] for f in fragments)
-                print(f"WARNING: Fragment lengths don't sum to sequence length! ({total} vs {len(dna_sequence)})")
+            if not validate_fragment_total(fragments, seq_len):
+                total = sum(digest_sizes)
+                print(f"WARNING: Fragment lengths don't sum to sequence length! ({total} vs {seq_len})")
             else:
-                print(f"✓ Fragment lengths sum correctly to {len(dna_sequence)} bp")
+                print(f"✓ Fragment lengths sum correctly to {seq_len} bp")
             
             # Display sequences if requested
             if args.include_seqs and fragments_with_seqs:
@@ -1166,9 +1413,11 @@ Examples:
                 print("FRAGMENT SEQUENCES")
                 print("=" * 80)
                 
+                mode = 'circular' if args.circular else 'linear'
+                seq_lines = []
                 for idx, frag in enumerate(fragments_with_seqs):
-                    print(f"\n# Fragment {idx + 1} (length: {frag.length} bp)")
-                    print(f"start={frag.start_idx}  end={frag.end_idx}  mode={'circular' if args.circular else 'linear'}")
+                    seq_lines.append(f"\n# Fragment {idx + 1} (length: {frag.length} bp)")
+                    seq_lines.append(f"start={frag.start_idx}  end={frag.end_idx}  mode={mode}")
                     
                     # Display end information
                     left_end, right_end = frag.enzymes_at_ends
@@ -1189,24 +1438,27 @@ Examples:
                     else:
                         right_str = "END"
                     
-                    print(f"ends: left={left_str}, right={right_str}")
+                    seq_lines.append(f"ends: left={left_str}, right={right_str}")
                     
                     # Display sequence (with optional elision)
                     display_seq = elide_sequence(frag.sequence, args.seq_context)
-                    print(f"seq: {display_seq}")
+                    seq_lines.append(f"seq: {display_seq}")
                 
-                print()
+                seq_lines.append("")
+                sys.stdout.write('\n'.join(seq_lines) + '\n')
             
             # Display cut site details
             if all_cuts:
                 print()
                 print("Cut Site Details:")
                 print("-" * 80)
-                for pos in sorted(all_cuts):
-                    enzymes_at_pos = cut_metadata.get(pos, [])
-                    for enz_meta in enzymes_at_pos:
-                        print(f"  Position {pos}: {enz_meta['enzyme']} "
-                              f"(site: {enz_meta['site']}, overhang: {enz_meta['overhang_type']})")
+                detail_lines = [
+                    f"  Position {event.pos}: {event.enzyme} "
+                    f"(site: {event.site}, overhang: {event.overhang_type})"
+                    for event in cut_events
+                ]
+                if detail_lines:
+                    sys.stdout.write('\n'.join(detail_lines) + '\n')
             
             print()
         
@@ -1223,7 +1475,7 @@ Examples:
                 print("=" * 80)
             
             restriction_map = build_restriction_map(
-                L=len(dna_sequence),
+                L=seq_len,
                 cut_events=cut_events,
                 circular=args.circular,
                 map_width=args.map_width,
@@ -1242,10 +1494,10 @@ Examples:
         if args.simulate_gel or args.gel_only:
             # Load ladder
             try:
-                ladder_bp = get_ladder(args.gel_ladder)
+                ladder_bp = get_ladder_tuple(args.gel_ladder)
             except ValueError as e:
                 print(f"Error: {e}")
-                sys.exit(1)
+                return 1
             
             # Prepare lanes for gel simulation
             gel_lanes = []
@@ -1255,11 +1507,11 @@ Examples:
                 try:
                     # Try to parse as JSON string first
                     if args.lanes_config.strip().startswith('[') or args.lanes_config.strip().startswith('{'):
-                        lanes_cfg_data = json.loads(args.lanes_config)
+                        lanes_cfg_data = _json_loads(args.lanes_config)
                     else:
                         # Try to load from file
-                        with open(args.lanes_config, 'r') as f:
-                            lanes_cfg_data = json.load(f)
+                        with open(args.lanes_config, 'rb') as f:
+                            lanes_cfg_data = _json_loads(f.read())
                     
                     # Ensure it's a list
                     if isinstance(lanes_cfg_data, dict):
@@ -1270,6 +1522,7 @@ Examples:
                         raise ValueError("lanes-config must be a JSON array of lane objects")
                     
                     lanes_data = lanes_cfg_data
+                    main_digest_key = (frozenset(validated_enzymes), args.circular)
                     
                     # Process each lane configuration
                     for lane_idx, lane_config in enumerate(lanes_data):
@@ -1290,42 +1543,61 @@ Examples:
                         lane_circular = lane_config.get('circular', args.circular)
                         lane_notes = lane_config.get('notes', '')
                         
-                        # Compute fragments for this lane
-                        lane_cuts_by_enzyme = {}
-                        lane_cut_metadata = {}
-                        
-                        for enz_name in lane_enzymes:
-                            if enz_name not in ENZYMES:
-                                print(f"Warning: Enzyme '{enz_name}' not found, skipping in lane '{lane_label}'")
-                                continue
+                        # A lane digesting the same enzyme set and topology as --enz
+                        # reuses the main digest instead of rescanning the sequence
+                        lane_key = (frozenset(lane_enzymes), lane_circular)
+                        if lane_key == main_digest_key and all(e in ENZYMES for e in lane_enzymes):
+                            lane_all_cuts = all_cuts
+                            fragment_sizes = digest_sizes
+                        else:
+                            # Compute fragments for this lane
+                            lane_cuts_by_enzyme = {}
+                            lane_cut_metadata = defaultdict(list)
                             
-                            enz_info = ENZYMES[enz_name]
-                            enz_cuts = find_cut_positions_linear(dna_sequence, enz_name, ENZYMES, circular=lane_circular)
-                            lane_cuts_by_enzyme[enz_name] = enz_cuts
+                            known_lane_enzymes = []
+                            for enz_name in lane_enzymes:
+                                if enz_name not in ENZYMES:
+                                    print(f"Warning: Enzyme '{enz_name}' not found, skipping in lane '{lane_label}'")
+                                    continue
+                                known_lane_enzymes.append(enz_name)
                             
-                            for pos in enz_cuts:
-                                if pos not in lane_cut_metadata:
-                                    lane_cut_metadata[pos] = []
-                                lane_cut_metadata[pos].append({
-                                    'enzyme': enz_name,
-                                    'site': enz_info['sequence'],
-                                    'cut_index': enz_info['cut_index'],
-                                    'overhang_type': enz_info['overhang_type']
-                                })
-                        
-                        lane_all_cuts = merge_cut_positions(lane_cuts_by_enzyme, len(dna_sequence))
-                        
-                        # Compute fragments for this lane
-                        lane_fragments = compute_fragments(
-                            cut_positions=lane_all_cuts,
-                            seq_len=len(dna_sequence),
-                            circular=lane_circular,
-                            circular_single_cut_linearizes=args.circular_single_cut_linearizes,
-                            cut_metadata=lane_cut_metadata
-                        )
-                        
-                        # Extract fragment sizes
-                        fragment_sizes = [f['length'] for f in lane_fragments]
+                            # Scan the sequence once for all enzymes in this lane
+                            lane_site_cuts = find_cut_sites_multi(
+                                dna_sequence,
+                                [(ENZYMES[name]['sequence'], ENZYMES[name]['cut_index']) for name in known_lane_enzymes],
+                                circular=lane_circular
+                            )
+                            
+                            for enz_name, enz_cuts in zip(known_lane_enzymes, lane_site_cuts):
+                                enz_info = ENZYMES[enz_name]
+                                enz_site = enz_info['sequence']
+                                enz_cut_index = enz_info['cut_index']
+                                enz_overhang_type = enz_info['overhang_type']
+                            
+                                lane_cuts_by_enzyme[enz_name] = enz_cuts
+                            
+                                enz_meta = CutMeta(
+                                    enzyme=enz_name,
+                                    site=enz_site,
+                                    cut_index=enz_cut_index,
+                                    overhang_type=enz_overhang_type
+                                )
+                                for pos in enz_cuts:
+                                    lane_cut_metadata[pos].append(enz_meta)
+                            
+                            lane_all_cuts = merge_cut_positions(lane_cuts_by_enzyme, seq_len)
+                            
+                            # Compute fragments for this lane
+                            lane_fragments = compute_fragments(
+                                cut_positions=lane_all_cuts,
+                                seq_len=seq_len,
+                                circular=lane_circular,
+                                circular_single_cut_linearizes=args.circular_single_cut_linearizes,
+                                cut_metadata=lane_cut_metadata
+                            )
+                            
+                            # Extract fragment sizes
+                            fragment_sizes = [f['length'] for f in lane_fragments]
                         
                         # Determine topology for gel rendering
                         gel_topology = args.gel_topology
@@ -1362,19 +1634,19 @@ Examples:
                     print("Optional fields:")
                     print("  - circular: boolean (default: false)")
                     print("  - notes: string (additional information)")
-                    sys.exit(1)
+                    return 1
                 except FileNotFoundError:
                     print(f"Error: Could not find lanes-config file: {args.lanes_config}")
-                    sys.exit(1)
+                    return 1
                 except ValueError as e:
                     print(f"Error: {e}")
                     print()
                     print("Expected format: [{'label': 'Lane1', 'enzymes': ['EcoRI']}]")
-                    sys.exit(1)
+                    return 1
             
             else:
                 # Use current digest as single lane
-                fragment_sizes = [f['length'] for f in fragments]
+                fragment_sizes = digest_sizes
                 lane_label = '+'.join(validated_display_names)
                 
                 # Determine topology for gel rendering
@@ -1421,29 +1693,21 @@ Examples:
         
         # Generate graphics outputs if requested
         if args.out_svg or args.out_svg_linear or args.out_svg_fragments:
-            # Build cut list with metadata for graphics
-            cuts_for_graphics = []
-            for pos in sorted(all_cuts):
-                enzymes_at_pos = cut_metadata.get(pos, [])
-                for enz_meta in enzymes_at_pos:
-                    cuts_for_graphics.append({
-                        'pos': pos,
-                        'enzyme': enz_meta['enzyme'],
-                        'site': enz_meta['site'],
-                        'overhang_type': enz_meta['overhang_type']
-                    })
-            
             # Determine title
             graphics_title = args.title if args.title else (
                 "Plasmid" if args.circular else "DNA"
             )
             
+            # Width is shared by the linear map and fragment diagram; titles and
+            # heights keep per-diagram defaults
+            svg_width = args.svg_width if args.svg_width else 900
+            
             # Generate plasmid map SVG
             if args.out_svg:
                 try:
                     svg_content = render_plasmid_map(
-                        L=len(dna_sequence),
-                        cuts=cuts_for_graphics,
+                        L=seq_len,
+                        cuts=cut_events,
                         title=graphics_title,
                         origin=args.origin,
                         show_sites=args.show_sites,
@@ -1451,15 +1715,17 @@ Examples:
                         theme=args.theme
                     )
                     
-                    with open(args.out_svg, 'w') as f:
-                        f.write(svg_content)
+                    # Minify and encode once; the same bytes go to disk and to the PNG converter
+                    svg_bytes = minify_svg(svg_content).encode('utf-8')
+                    with open(args.out_svg, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                        f.write(svg_bytes)
                     print(f"\n✓ Plasmid map saved to: {args.out_svg}")
                     
                     # Generate PNG if requested
                     if args.png:
                         png_path = args.out_svg.rsplit('.', 1)[0] + '.png'
                         try:
-                            svg_to_png(svg_content, png_path)
+                            svg_to_png(svg_bytes, png_path)
                             print(f"✓ PNG saved to: {png_path}")
                         except ImportError as e:
                             print(f"Warning: Could not generate PNG - {e}")
@@ -1476,12 +1742,11 @@ Examples:
             if args.out_svg_linear:
                 try:
                     linear_title = args.title if args.title else "Restriction Map"
-                    svg_width = args.svg_width if args.svg_width else 900
                     svg_height = args.svg_height if args.svg_height else 180
                     
                     svg_content = render_linear_map(
-                        L=len(dna_sequence),
-                        cuts=cuts_for_graphics,
+                        L=seq_len,
+                        cuts=cut_events,
                         title=linear_title,
                         width=svg_width,
                         height=svg_height,
@@ -1490,15 +1755,17 @@ Examples:
                         theme=args.theme
                     )
                     
-                    with open(args.out_svg_linear, 'w') as f:
-                        f.write(svg_content)
+                    # Minify and encode once; the same bytes go to disk and to the PNG converter
+                    svg_bytes = minify_svg(svg_content).encode('utf-8')
+                    with open(args.out_svg_linear, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                        f.write(svg_bytes)
                     print(f"✓ Linear map saved to: {args.out_svg_linear}")
                     
                     # Generate PNG if requested
                     if args.png:
                         png_path = args.out_svg_linear.rsplit('.', 1)[0] + '.png'
                         try:
-                            svg_to_png(svg_content, png_path)
+                            svg_to_png(svg_bytes, png_path)
                             print(f"✓ PNG saved to: {png_path}")
                         except ImportError as e:
                             print(f"Warning: Could not generate PNG - {e}")
@@ -1514,12 +1781,11 @@ Examples:
             if args.out_svg_fragments:
                 try:
                     frag_title = args.title if args.title else "Fragments"
-                    svg_width = args.svg_width if args.svg_width else 900
                     svg_height = args.svg_height if args.svg_height else 140
                     
                     svg_content = render_fragment_diagram(
                         fragments=fragments,
-                        L=len(dna_sequence),
+                        L=seq_len,
                         title=frag_title,
                         width=svg_width,
                         height=svg_height,
@@ -1527,15 +1793,17 @@ Examples:
                         annotate_sizes=True
                     )
                     
-                    with open(args.out_svg_fragments, 'w') as f:
-                        f.write(svg_content)
+                    # Minify and encode once; the same bytes go to disk and to the PNG converter
+                    svg_bytes = minify_svg(svg_content).encode('utf-8')
+                    with open(args.out_svg_fragments, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                        f.write(svg_bytes)
                     print(f"✓ Fragment diagram saved to: {args.out_svg_fragments}")
                     
                     # Generate PNG if requested
                     if args.png:
                         png_path = args.out_svg_fragments.rsplit('.', 1)[0] + '.png'
                         try:
-                            svg_to_png(svg_content, png_path)
+                            svg_to_png(svg_bytes, png_path)
                             print(f"✓ PNG saved to: {png_path}")
                         except ImportError as e:
                             print(f"Warning: Could not generate PNG - {e}")
@@ -1550,38 +1818,30 @@ Examples:
         # Generate FASTA output if requested
         if args.fasta_out and fragments_with_seqs:
             try:
-                with open(args.fasta_out, 'w') as fasta_file:
-                    for idx, frag in enumerate(fragments_with_seqs):
-                        # Build FASTA header with fragment information
-                        frag_id = f"frag_{idx+1:03d}"
-                        
-                        # Left end info
+                with open(args.fasta_out, 'wb', buffering=WRITE_BUFFER_SIZE) as fasta_file:
+                    # Records are assembled whole and flushed in batches of FASTA_BATCH_RECORDS
+                    batch = []
+                    for frag_num, frag in enumerate(fragments_with_seqs, 1):
+                        # Build FASTA header with fragment and end information
                         left_end, right_end = frag.enzymes_at_ends
-                        if left_end and left_end.overhang_len > 0:
-                            left_info = f"{left_end.enzyme}:{left_end.overhang_type[0]}p:{left_end.overhang_len}:{left_end.end_bases}"
-                        elif left_end:
-                            left_info = f"{left_end.enzyme}:blunt:0"
-                        else:
-                            left_info = "START"
-                        
-                        # Right end info
-                        if right_end and right_end.overhang_len > 0:
-                            right_info = f"{right_end.enzyme}:{right_end.overhang_type[0]}p:{right_end.overhang_len}:{right_end.end_bases}"
-                        elif right_end:
-                            right_info = f"{right_end.enzyme}:blunt:0"
-                        else:
-                            right_info = "END"
-                        
-                        # Write header
-                        header = f">{frag_id}|len={frag.length}|start={frag.start_idx}|end={frag.end_idx}|left={left_info}|right={right_info}"
+                        header = FASTA_HEADER_FMT % (
+                            frag_num, frag.length, frag.start_idx, frag.end_idx,
+                            fasta_end_label(left_end, "START"), fasta_end_label(right_end, "END")
+                        )
                         if frag.wraps:
                             header += "|wraps=True"
-                        fasta_file.write(header + "\n")
                         
-                        # Write sequence (wrapped at 80 characters)
-                        seq = frag.sequence
-                        for i in range(0, len(seq), 80):
-                            fasta_file.write(seq[i:i+80] + "\n")
+                        # Header plus sequence wrapped at 80 characters, as one record. The
+                        # sequence is validated ASCII, so it is encoded once and sliced as bytes
+                        seq_b = frag.sequence.encode('ascii')
+                        record_lines = [header.encode('utf-8')]
+                        record_lines.extend(seq_b[i:i+80] for i in range(0, len(seq_b), 80))
+                        batch.append(b'\n'.join(record_lines) + b'\n')
+                        if len(batch) >= FASTA_BATCH_RECORDS:
+                            fasta_file.writelines(batch)
+                            batch.clear()
+                    
+                    fasta_file.writelines(batch)
                 
                 print(f"\n✓ Fragment sequences saved to: {args.fasta_out}")
                 print(f"  Total fragments: {len(fragments_with_seqs)}")
@@ -1624,8 +1884,8 @@ Examples:
                         output = format_pairs_output(compat_results)
                         print(output)
                     elif args.compat_summary == "matrix":
-                        output = format_matrix_output(compat_results, fragment_ends)
-                        print(output)
+                        # Streamed row by row; the matrix grows with the square of the end count
+                        write_matrix_output(compat_results, fragment_ends)
                     elif args.compat_summary == "detailed":
                         output = format_detailed_output(compat_results)
                         print(output)
@@ -1641,41 +1901,20 @@ Examples:
                             print(f"Error writing JSON file: {e}")
             
             except Exception as e:
-                print(f"Error during compatibility analysis: {e}")
-                import traceback
-                traceback.print_exc()
+                report_error(f"Error during compatibility analysis: {e}")
+        
+        # Export destinations, read once for the export section below
+        genbank_path = args.export_genbank
+        csv_prefix = args.export_csv
+        
+        # Cut rows and topology shared by the GenBank and CSV exporters
+        if genbank_path or csv_prefix:
+            export_cuts = build_export_cuts(dna_sequence, sorted_cuts, cut_metadata, args.circular)
+            export_topology = args.topology if args.topology else ("circular" if args.circular else "linear")
         
         # Export to GenBank if requested
-        if args.export_genbank:
+        if genbank_path:
             try:
-                # Build cuts list for export
-                export_cuts = []
-                for pos in sorted(all_cuts):
-                    enzymes_at_pos = cut_metadata.get(pos, [])
-                    for enz_meta in enzymes_at_pos:
-                        # Use centralized function to compute overhang metadata
-                        end_meta = compute_end_metadata(
-                            dna=dna_sequence,
-                            cut_pos=pos,
-                            recognition_site=enz_meta['site'],
-                            cut_index=enz_meta['cut_index'],
-                            overhang_type=enz_meta['overhang_type'],
-                            is_left_end=True,  # Doesn't matter for just getting length
-                            circular=args.circular
-                        )
-                        
-                        export_cuts.append({
-                            'pos': pos,
-                            'enzyme': enz_meta['enzyme'],
-                            'recognition_site': enz_meta['site'],
-                            'cut_index': enz_meta['cut_index'],
-                            'overhang_type': enz_meta['overhang_type'],
-                            'overhang_len': end_meta['overhang_len']
-                        })
-                
-                # Determine topology for export
-                export_topology = args.topology if args.topology else ("circular" if args.circular else "linear")
-                
                 # Determine definition
                 gb_definition = args.gb_definition if args.gb_definition else "Restriction digest export"
                 
@@ -1683,50 +1922,20 @@ Examples:
                     sequence=dna_sequence,
                     cuts=export_cuts,
                     fragments=fragments,
-                    path=args.export_genbank,
+                    path=genbank_path,
                     topology=export_topology,
                     definition=gb_definition,
                     organism=args.source
                 )
             
             except Exception as e:
-                print(f"Error exporting GenBank file: {e}")
-                import traceback
-                traceback.print_exc()
+                report_error(f"Error exporting GenBank file: {e}")
         
         # Export to CSV if requested
-        if args.export_csv:
+        if csv_prefix:
             try:
-                # Build cuts list for export (using centralized function)
-                export_cuts = []
-                for pos in sorted(all_cuts):
-                    enzymes_at_pos = cut_metadata.get(pos, [])
-                    for enz_meta in enzymes_at_pos:
-                        # Use centralized function to compute overhang metadata
-                        end_meta = compute_end_metadata(
-                            dna=dna_sequence,
-                            cut_pos=pos,
-                            recognition_site=enz_meta['site'],
-                            cut_index=enz_meta['cut_index'],
-                            overhang_type=enz_meta['overhang_type'],
-                            is_left_end=True,  # Doesn't matter for just getting length
-                            circular=args.circular
-                        )
-                        
-                        export_cuts.append({
-                            'pos': pos,
-                            'enzyme': enz_meta['enzyme'],
-                            'recognition_site': enz_meta['site'],
-                            'cut_index': enz_meta['cut_index'],
-                            'overhang_type': enz_meta['overhang_type'],
-                            'overhang_len': end_meta['overhang_len']
-                        })
-                
-                # Determine topology for export
-                export_topology = args.topology if args.topology else ("circular" if args.circular else "linear")
-                
                 export_csv(
-                    prefix=args.export_csv,
+                    prefix=csv_prefix,
                     cuts=export_cuts,
                     fragments=fragments,
                     topology=export_topology,
@@ -1734,17 +1943,17 @@ Examples:
                 )
             
             except Exception as e:
-                print(f"Error exporting CSV files: {e}")
-                import traceback
-                traceback.print_exc()
+                report_error(f"Error exporting CSV files: {e}")
 
     except (FileNotFoundError, ValueError) as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
-        sys.exit(1)
+        return 1
+    
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())